@@ -0,0 +1,63 @@
+"""
+Tablas de verdad completas de los circuitos de practice/ (S07P00...S07P10).
+
+Cada script de practice/ prueba una sola entrada; aquí cada circuito se
+recorre con todas sus entradas en una llamada.
+
+    python tablas_verdad.py                 # unitaria, sin qvm
+    python tablas_verdad.py --backend qvm   # programa paramétrico compilado una vez
+    python tablas_verdad.py --optimizar     # tablas del circuito optimizado e informe de pases
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "S14"))
+
+import numpy as np
+from pyquil import Program
+from pyquil.gates import CCNOT, CNOT, CSWAP, CZ, SWAP
+
+from utils.optimizacion import imprimir_informe, optimizar_programa
+from utils.tabla_verdad import BACKENDS, imprimir_tabla_verdad, permutacion, tabla_verdad
+
+
+CIRCUITOS = {
+    "S07P00 - SWAP": (Program(SWAP(0, 1)), 2),
+    "S07P01 - CNOT": (Program(CNOT(0, 1)), 2),
+    "S07P02 - CZ": (Program(CZ(0, 1)), 2),
+    "S07P03 - SWAP con tres CNOT": (Program(CNOT(1, 0), CNOT(0, 1), CNOT(1, 0)), 2),
+    "S07P04 - CSWAP": (Program(CSWAP(0, 1, 2)), 3),
+    "S07P05/P06-P09 - CCNOT": (Program(CCNOT(0, 1, 2)), 3),
+    "S07P10 - CNOT en cascada": (
+        Program(CNOT(1, 2), CNOT(0, 2), CNOT(1, 2), CNOT(0, 2), CNOT(0, 1), CNOT(0, 1)), 3
+    ),
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tablas de verdad de los circuitos del S07")
+    parser.add_argument("--backend", default="unitaria", choices=BACKENDS)
+    parser.add_argument("--shots", type=int, default=1)
+    parser.add_argument("--optimizar", action="store_true")
+    args = parser.parse_args(argv)
+
+    for nombre, (circuito, num_qubits) in CIRCUITOS.items():
+        if args.optimizar:
+            circuito, informe = optimizar_programa(circuito)
+            puertas = "; ".join(str(instr) for instr in circuito.instructions) or "(vacío)"
+            print(f"\n{nombre}: {puertas}")
+            imprimir_informe(informe)
+
+        tabla = tabla_verdad(circuito, num_qubits, backend=args.backend, num_shots=args.shots)
+        imprimir_tabla_verdad(tabla, f"\n{nombre}")
+
+        # CZ no permuta la base, solo cambia la fase de |11⟩
+        _, fases = permutacion(circuito, num_qubits)
+        if not np.allclose(fases, 1):
+            print(f"Fases: {np.round(fases.real, 3).tolist()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""
+Benchmark de ejecución de circuitos
+"""
+
+from .suite import (
+    medir,
+    resumir,
+    barrido,
+    comparar_competiciones,
+    imprimir_comparacion,
+    imprimir_tabla,
+    guardar_json,
+    detectar_regresiones
+)
+from .nucleos import comparar_nucleos, imprimir_nucleos
+
+__all__ = [
+    'medir',
+    'resumir',
+    'barrido',
+    'comparar_competiciones',
+    'imprimir_comparacion',
+    'imprimir_tabla',
+    'guardar_json',
+    'detectar_regresiones',
+    'comparar_nucleos',
+    'imprimir_nucleos'
+]
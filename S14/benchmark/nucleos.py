@@ -0,0 +1,114 @@
+"""
+Micro-benchmarks de los núcleos del simulador local frente a la contracción densa.
+
+Cada puerta se aplica una vez sobre un estado aleatorio de n qubits, con
+sus qubits repartidos por el registro (primero, centro y último), y se
+compara la mediana del núcleo especializado con la de aplicar_matriz.
+
+    python benchmark/nucleos.py --qubits 16 20
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+from pyquil import Program
+from pyquil.gates import CCNOT, CNOT, CPHASE, CSWAP, CZ, H, I, RX, RY, S, SWAP, T, X, Z
+
+from benchmark.suite import guardar_json, medir
+from utils.simulador_local import CircuitoLocal, aplicar_matriz, aplicar_nucleo
+
+
+PUERTAS = {
+    'permutacion': {
+        'X': lambda a, b, c: X(a),
+        'CNOT': lambda a, b, c: CNOT(a, b),
+        'SWAP': lambda a, b, c: SWAP(a, b),
+        'CCNOT': lambda a, b, c: CCNOT(a, b, c),
+        'CSWAP': lambda a, b, c: CSWAP(a, b, c),
+    },
+    'diagonal': {
+        'Z': lambda a, b, c: Z(a),
+        'S': lambda a, b, c: S(a),
+        'T': lambda a, b, c: T(a),
+        'CZ': lambda a, b, c: CZ(a, b),
+        'CPHASE': lambda a, b, c: CPHASE(np.pi / 4, a, b),
+    },
+    'controlada': {
+        'CH': lambda a, b, c: H(b).controlled(a),
+        'CRY': lambda a, b, c: RY(0.3, b).controlled(a),
+    },
+    'densa': {
+        'H': lambda a, b, c: H(a),
+        'RX': lambda a, b, c: RX(0.3, a),
+    },
+}
+
+
+def _operacion(puerta, num_qubits):
+    # Las identidades solo fijan el tamaño del registro; se usa la última operación
+    circuito = CircuitoLocal(Program([I(q) for q in range(num_qubits)], puerta))
+    matriz, ejes = circuito.operaciones[-1]
+    return matriz, ejes, circuito.nucleos[-1]
+
+
+def comparar_nucleos(qubits=(16, 20), repeticiones=10, calentamiento=2, semilla=0):
+    """Una fila por puerta y tamaño con las medianas densa y especializada"""
+    rng = np.random.default_rng(semilla)
+    filas = []
+
+    for n in qubits:
+        estado = rng.normal(size=(2,) * n) + 1j * rng.normal(size=(2,) * n)
+        estado /= np.linalg.norm(estado)
+        a, b, c = 0, n // 2, n - 1
+
+        for clase, puertas in PUERTAS.items():
+            for nombre, crear in puertas.items():
+                matriz, ejes, nucleo = _operacion(crear(a, b, c), n)
+                if not np.allclose(aplicar_nucleo(estado.copy(), nucleo), aplicar_matriz(estado, matriz, ejes)):
+                    raise AssertionError(f"El núcleo de {nombre} no coincide con la contracción densa")
+
+                trabajo = estado.copy()
+                denso = np.median(medir(lambda: aplicar_matriz(estado, matriz, ejes), repeticiones, calentamiento))
+                especializado = np.median(medir(lambda: aplicar_nucleo(trabajo, nucleo), repeticiones,
+                                                calentamiento))
+                filas.append({
+                    'clase': clase,
+                    'puerta': nombre,
+                    'qubits': n,
+                    'nucleo': nucleo[2],
+                    'denso_s': float(denso),
+                    'nucleo_s': float(especializado),
+                    'speedup': float(denso / especializado) if especializado > 0 else float("inf")
+                })
+    return filas
+
+
+def imprimir_nucleos(filas):
+    print(f"{'clase':<12}{'puerta':<8}{'qb':>4}  {'núcleo':<12}{'denso':>11}{'núcleo':>11}{'speedup':>9}")
+    for f in filas:
+        print(f"{f['clase']:<12}{f['puerta']:<8}{f['qubits']:>4}  {f['nucleo']:<12}"
+              f"{f['denso_s'] * 1e3:>9.2f}ms{f['nucleo_s'] * 1e3:>9.2f}ms{f['speedup']:>8.1f}x")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Núcleos especializados frente a la contracción densa")
+    parser.add_argument("--qubits", type=int, nargs="+", default=[16, 20])
+    parser.add_argument("--repeticiones", type=int, default=10)
+    parser.add_argument("--calentamiento", type=int, default=2)
+    parser.add_argument("--salida", help="JSON con los resultados")
+    args = parser.parse_args(argv)
+
+    filas = comparar_nucleos(args.qubits, args.repeticiones, args.calentamiento)
+    imprimir_nucleos(filas)
+    if args.salida:
+        guardar_json(filas, args.salida)
+        print(f"\nResultados guardados en {args.salida}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+import argparse
+import asyncio
+import itertools
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+import pyquil
+
+from utils.asincrono import ejecutar_programa_async
+from utils.lote import ejecutar_lote
+from utils.quantum_utils import crear_programa_base, ejecutar_programa, medir_qubits
+
+
+MODOS = ("secuencial", "hilos", "procesos", "async")
+
+
+def medir(funcion, repeticiones=10, calentamiento=2):
+    """Tiempos (s) de varias repeticiones de funcion() con reloj monótono, tras calentar"""
+    for _ in range(calentamiento):
+        funcion()
+
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    return tiempos
+
+
+def resumir(tiempos, shots_por_repeticion):
+    tiempos = np.asarray(tiempos)
+    mediana = float(np.median(tiempos))
+    return {
+        'repeticiones': len(tiempos),
+        'media_s': float(tiempos.mean()),
+        'mediana_s': mediana,
+        'p95_s': float(np.percentile(tiempos, 95)),
+        'p99_s': float(np.percentile(tiempos, 99)),
+        'shots_por_segundo': shots_por_repeticion / mediana if mediana > 0 else float("inf")
+    }
+
+
+def _programa(num_qubits):
+    return medir_qubits(crear_programa_base(num_qubits), list(range(num_qubits)))
+
+
+def _carga(modo, jugadores, shots, num_qubits, backend):
+    programas = [_programa(num_qubits) for _ in range(jugadores)]
+
+    if modo == "secuencial":
+        return lambda: [ejecutar_programa(p, shots, backend=backend) for p in programas]
+    if modo == "hilos":
+        return lambda: ejecutar_lote(programas, shots, executor="thread", max_workers=jugadores,
+                                     backend=backend)
+    if modo == "procesos":
+        return lambda: ejecutar_lote(programas, shots, executor="process", backend=backend)
+    if modo == "async":
+        async def _todos():
+            return await asyncio.gather(*(ejecutar_programa_async(p, shots, backend=backend)
+                                          for p in programas))
+        return lambda: asyncio.run(_todos())
+    raise ValueError(f"Modo desconocido: {modo}")
+
+
+def barrido(jugadores=(1, 4, 16), shots=(50, 1000), qubits=(1, 3), backends=("local",),
+            modos=MODOS, repeticiones=10, calentamiento=2):
+    """Mide cada combinación de parámetros y devuelve una fila por punto"""
+    filas = []
+
+    for backend, modo, j, s, q in itertools.product(backends, modos, jugadores, shots, qubits):
+        tiempos = medir(_carga(modo, j, s, q, backend), repeticiones, calentamiento)
+        fila = {'backend': backend, 'modo': modo, 'jugadores': j, 'shots': s, 'qubits': q}
+        fila.update(resumir(tiempos, j * s))
+        filas.append(fila)
+
+    return filas
+
+
+def comparar_competiciones(num_tiradas=50, repeticiones=5, calentamiento=1, backend="qvm"):
+    """
+    Mediana/p95 de cada competición de moneda_cuantica y speedup frente a la
+    secuencial. Por defecto contra el QVM: lo que se compara es la espera de red.
+    """
+    from multithreading.moneda_cuantica import (
+        competicion_secuencial,
+        competicion_multithreading,
+        competicion_async
+    )
+
+    competiciones = {
+        'secuencial': lambda: competicion_secuencial(num_tiradas, backend),
+        'multithreading': lambda: competicion_multithreading(num_tiradas, backend),
+        'asyncio': lambda: competicion_async(4, num_tiradas, backend=backend)
+    }
+
+    resumen = {
+        nombre: resumir(medir(funcion, repeticiones, calentamiento), 4 * num_tiradas)
+        for nombre, funcion in competiciones.items()
+    }
+    base = resumen['secuencial']['mediana_s']
+    for datos in resumen.values():
+        datos['speedup'] = base / datos['mediana_s']
+
+    return resumen
+
+
+def imprimir_comparacion(resumen):
+    print("="*60)
+    print("COMPARACIÓN (mediana de varias repeticiones)")
+    print("="*60)
+    for nombre, datos in resumen.items():
+        print(f"{nombre:<16} mediana {datos['mediana_s']:.3f}s  p95 {datos['p95_s']:.3f}s  "
+              f"speedup {datos['speedup']:.2f}x")
+    print("="*60 + "\n")
+
+
+def imprimir_tabla(filas):
+    print(f"{'backend':<8}{'modo':<12}{'jug':>5}{'shots':>7}{'qb':>4}"
+          f"{'mediana':>11}{'p95':>11}{'p99':>11}{'shots/s':>13}")
+    for f in filas:
+        print(f"{f['backend']:<8}{f['modo']:<12}{f['jugadores']:>5}{f['shots']:>7}{f['qubits']:>4}"
+              f"{f['mediana_s'] * 1e3:>9.2f}ms{f['p95_s'] * 1e3:>9.2f}ms{f['p99_s'] * 1e3:>9.2f}ms"
+              f"{f['shots_por_segundo']:>13.0f}")
+
+
+def guardar_json(filas, ruta):
+    datos = {
+        'metadatos': {
+            'fecha': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pyquil': pyquil.__version__,
+            'maquina': platform.platform()
+        },
+        'resultados': filas
+    }
+    Path(ruta).write_text(json.dumps(datos, indent=2, ensure_ascii=False))
+
+
+def detectar_regresiones(filas, ruta_referencia, tolerancia=0.2):
+    """Puntos cuya mediana empeora más de `tolerancia` respecto a un JSON anterior"""
+    referencia = json.loads(Path(ruta_referencia).read_text())['resultados']
+    claves = ('backend', 'modo', 'jugadores', 'shots', 'qubits')
+    anteriores = {tuple(f[c] for c in claves): f for f in referencia}
+
+    regresiones = []
+    for fila in filas:
+        anterior = anteriores.get(tuple(fila[c] for c in claves))
+        if anterior and fila['mediana_s'] > anterior['mediana_s'] * (1 + tolerancia):
+            regresiones.append({
+                **{c: fila[c] for c in claves},
+                'antes_s': anterior['mediana_s'],
+                'ahora_s': fila['mediana_s']
+            })
+    return regresiones
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de ejecución de circuitos S14")
+    parser.add_argument("--jugadores", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--shots", type=int, nargs="+", default=[50, 1000])
+    parser.add_argument("--qubits", type=int, nargs="+", default=[1, 3])
+    parser.add_argument("--backends", nargs="+", default=["local"], choices=["local", "qvm"])
+    parser.add_argument("--modos", nargs="+", default=list(MODOS), choices=MODOS)
+    parser.add_argument("--repeticiones", type=int, default=10)
+    parser.add_argument("--calentamiento", type=int, default=2)
+    parser.add_argument("--salida", default="benchmark.json")
+    parser.add_argument("--referencia", help="JSON de una ejecución anterior para detectar regresiones")
+    parser.add_argument("--tolerancia", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    filas = barrido(args.jugadores, args.shots, args.qubits, args.backends, args.modos,
+                    args.repeticiones, args.calentamiento)
+    imprimir_tabla(filas)
+    guardar_json(filas, args.salida)
+    print(f"\nResultados guardados en {args.salida}")
+
+    if args.referencia:
+        regresiones = detectar_regresiones(filas, args.referencia, args.tolerancia)
+        for r in regresiones:
+            print(f"REGRESIÓN {r['backend']}/{r['modo']} j={r['jugadores']} s={r['shots']} "
+                  f"q={r['qubits']}: {r['antes_s'] * 1e3:.2f}ms → {r['ahora_s'] * 1e3:.2f}ms")
+        return 1 if regresiones else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,15 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
 from juego_moneda_trampa import (
     control_simple,
     copiar_bit,
-    correccion_error
+    correccion_error,
+    ejecutar_programa,
+    analizar_trampas,
+    imprimir_analisis
 )
 
 
@@ -32,7 +40,18 @@ def ejemplo_correccion():
     print(prog)
 
 
+def ejemplo_ejecucion_local():
+    print("\n" + "="*60)
+    print("EJEMPLO 4: 10000 INTENTOS EN EL SIMULADOR LOCAL")
+    print("="*60 + "\n")
+
+    # Una sola llamada: los shots se reparten entre las ramas del JUMP-WHEN
+    resultados = ejecutar_programa(copiar_bit(), 10000, backend="local")
+    imprimir_analisis(analizar_trampas(resultados))
+
+
 if __name__ == "__main__":
     ejemplo_control()
     ejemplo_copiar()
     ejemplo_correccion()
+    ejemplo_ejecucion_local()
@@ -1,7 +1,11 @@
-from pyquil import Program, get_qc
+from pyquil import Program
 from pyquil.gates import H, X, MEASURE
 from pyquil.quilbase import Declare
 
+from utils.cache_compilacion import compilar
+from utils.dinamico import ejecutar_dinamico
+from utils.pool_qc import pool_global
+
 
 def control_simple():
     prog = Program(
@@ -36,15 +40,20 @@ def correccion_error():
     return prog
 
 
-def ejecutar_programa(program, num_intentos=10):
-    qvm = get_qc('9q-square-qvm')
-    resultados = []
+def ejecutar_programa(program, num_intentos=10, backend="qvm"):
+    # El QVM repite el programa completo (saltos incluidos) en cada shot
+    program = program.copy().wrap_in_numshots_loop(num_intentos)
+
+    if backend == "local":
+        # Simulación en proceso: los shots se reparten por rama en cada medida
+        return list(ejecutar_dinamico(program).get("ro"))
+    if backend != "qvm":
+        raise ValueError(f"Backend desconocido: {backend}")
 
-    for _ in range(num_intentos):
-        result = qvm.run(qvm.compile(program))
-        resultados.append(result.get_register_map().get("ro")[0])
+    with pool_global.usar('9q-square-qvm') as qvm:
+        result = qvm.run(compilar(qvm, program))
 
-    return resultados
+    return list(result.get_register_map().get("ro"))
 
 
 def analizar_trampas(resultados):
@@ -17,6 +17,7 @@ def ejecutar_entregable1():
     from multithreading.moneda_cuantica import (
         competicion_secuencial,
         competicion_multithreading,
+        competicion_async,
         analizar_resultados,
         imprimir_resultados
     )
@@ -35,18 +36,19 @@ def ejecutar_entregable1():
     analisis_mt = analizar_resultados(resultados_mt)
     imprimir_resultados(analisis_mt, tiempo_mt)
 
-    # Comparación
-    mejora = ((tiempo_sec - tiempo_mt) / tiempo_sec) * 100
-    speedup = tiempo_sec / tiempo_mt
-
-    print("="*60)
-    print("COMPARACIÓN")
-    print("="*60)
-    print(f"Tiempo secuencial:     {tiempo_sec:.3f}s")
-    print(f"Tiempo multithreading: {tiempo_mt:.3f}s")
-    print(f"Speedup:               {speedup:.2f}x")
-    print(f"Mejora:                {mejora:.1f}%")
-    print("="*60 + "\n")
+    # Asyncio
+    print("Ejecutando asyncio...")
+    resultados_as, tiempo_as = competicion_async(4, num_tiradas)
+    analisis_as = analizar_resultados(resultados_as)
+    imprimir_resultados(analisis_as, tiempo_as)
+
+    # Comparación: varias repeticiones con reloj monótono
+    from benchmark import comparar_competiciones, imprimir_comparacion
+    imprimir_comparacion(comparar_competiciones(num_tiradas))
+
+    from utils.pool_qc import pool_global
+    stats = pool_global.estadisticas()
+    print(f"Pool QC: {stats['aciertos']} aciertos, {stats['fallos']} fallos\n")
 
 
 def ejecutar_entregable2():
@@ -97,6 +99,15 @@ def mostrar_info_qpu():
     print("\n" + "="*60 + "\n")
 
 
+def ejecutar_benchmark():
+    print("\n" + "="*60)
+    print("BENCHMARK")
+    print("="*60 + "\n")
+
+    from benchmark.suite import main as benchmark_main
+    benchmark_main(["--salida", "benchmark.json"])
+
+
 def menu():
     while True:
         print("\n" + "="*60)
@@ -105,6 +116,7 @@ def menu():
         print("\n1. Entregable 1: Multithreading")
         print("2. Entregable 2: Control Clásico")
         print("3. Info QPU Real")
+        print("4. Benchmark")
         print("0. Salir")
         print("\n" + "="*60)
 
@@ -118,6 +130,8 @@ def menu():
             ejecutar_entregable2()
         elif opcion == "3":
             mostrar_info_qpu()
+        elif opcion == "4":
+            ejecutar_benchmark()
         else:
             print("Opción no válida")
 
@@ -6,6 +6,8 @@ from .moneda_cuantica import (
     ejecutar_moneda,
     competicion_secuencial,
     competicion_multithreading,
+    competicion_async,
+    competicion_multiproceso,
     analizar_resultados,
     imprimir_resultados
 )
@@ -14,6 +16,8 @@ __all__ = [
     'ejecutar_moneda',
     'competicion_secuencial',
     'competicion_multithreading',
+    'competicion_async',
+    'competicion_multiproceso',
     'analizar_resultados',
     'imprimir_resultados'
 ]
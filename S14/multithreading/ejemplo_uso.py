@@ -1,3 +1,8 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
 from moneda_cuantica import (
     competicion_secuencial,
     competicion_multithreading,
@@ -23,18 +28,9 @@ def comparar_metodos():
     analisis_mt = analizar_resultados(resultados_mt)
     imprimir_resultados(analisis_mt, tiempo_mt)
 
-    # Comparación
-    mejora = ((tiempo_sec - tiempo_mt) / tiempo_sec) * 100
-    speedup = tiempo_sec / tiempo_mt
-
-    print("="*60)
-    print("ANÁLISIS DE RENDIMIENTO")
-    print("="*60)
-    print(f"Tiempo secuencial:     {tiempo_sec:.3f}s")
-    print(f"Tiempo multithreading: {tiempo_mt:.3f}s")
-    print(f"Speedup:               {speedup:.2f}x")
-    print(f"Mejora:                {mejora:.1f}%")
-    print("="*60 + "\n")
+    # Comparación: varias repeticiones con reloj monótono
+    from benchmark import comparar_competiciones, imprimir_comparacion
+    imprimir_comparacion(comparar_competiciones(num_tiradas))
 
 
 if __name__ == "__main__":
@@ -1,35 +1,41 @@
-from pyquil import Program, get_qc
+from pyquil import Program
 from pyquil.gates import H, MEASURE
 from pyquil.quilbase import Declare
 from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import time
 
+from utils.asincrono import ejecutar_programa_async
+from utils.lote import ejecutar_lote
+from utils.quantum_utils import ejecutar_programa
 
-def ejecutar_moneda(num_tiradas):
-    prog = Program(
+
+def crear_moneda():
+    return Program(
         Declare("ro", "BIT", 1),
         H(0),
         MEASURE(0, ("ro", 0))
     )
-    qvm = get_qc('9q-square-qvm')
-    prog = prog.wrap_in_numshots_loop(num_tiradas)
-    result = qvm.run(qvm.compile(prog))
-    return result.get_register_map().get("ro")
 
 
-def competicion_secuencial(num_tiradas=50):
-    inicio = time.time()
-    resultados = [ejecutar_moneda(num_tiradas) for _ in range(4)]
-    return resultados, time.time() - inicio
+def ejecutar_moneda(num_tiradas, backend="auto"):
+    # La moneda es Clifford: con "auto" va al simulador de estabilizadores; backend="qvm" fuerza el QVM
+    return ejecutar_programa(crear_moneda(), num_tiradas, backend=backend)
+
+
+def competicion_secuencial(num_tiradas=50, backend="auto"):
+    inicio = time.perf_counter()
+    resultados = [ejecutar_moneda(num_tiradas, backend) for _ in range(4)]
+    return resultados, time.perf_counter() - inicio
 
 
-def competicion_multithreading(num_tiradas=50):
-    inicio = time.time()
+def competicion_multithreading(num_tiradas=50, backend="auto"):
+    inicio = time.perf_counter()
 
     with ThreadPoolExecutor(max_workers=4) as executor:
         futures = []
         for _ in range(4):
-            future = executor.submit(ejecutar_moneda, num_tiradas)
+            future = executor.submit(ejecutar_moneda, num_tiradas, backend)
             futures.append(future)
 
         resultados = []
@@ -37,10 +43,32 @@ def competicion_multithreading(num_tiradas=50):
             resultado = f.result()
             resultados.append(resultado)
 
-    tiempo_total = time.time() - inicio
+    tiempo_total = time.perf_counter() - inicio
     return resultados, tiempo_total
 
 
+async def _competicion_async(num_jugadores, num_tiradas, limite_conexiones, backend):
+    tareas = [
+        ejecutar_programa_async(crear_moneda(), num_tiradas, backend=backend,
+                                limite_conexiones=limite_conexiones)
+        for _ in range(num_jugadores)
+    ]
+    return await asyncio.gather(*tareas)
+
+
+def competicion_async(num_jugadores=4, num_tiradas=50, limite_conexiones=8, backend="auto"):
+    inicio = time.perf_counter()
+    resultados = asyncio.run(_competicion_async(num_jugadores, num_tiradas, limite_conexiones, backend))
+    return list(resultados), time.perf_counter() - inicio
+
+
+def competicion_multiproceso(num_tiradas=50, num_jugadores=4, backend="local"):
+    inicio = time.perf_counter()
+    programas = [crear_moneda() for _ in range(num_jugadores)]
+    resultados = ejecutar_lote(programas, num_tiradas, executor="process", backend=backend)
+    return resultados, time.perf_counter() - inicio
+
+
 def analizar_resultados(resultados):
     caras = sum((r == 0).sum() for r in resultados)
     cruces = sum((r == 1).sum() for r in resultados)
@@ -8,10 +8,124 @@ from .quantum_utils import (
     medir_qubits,
     interpretar_resultado_binario
 )
+from .pool_qc import PoolQC, pool_global
+from .cache_compilacion import CacheCompilacion, cache_global, compilar
+from .simulador_local import CircuitoLocal, estado_final, matriz_unitaria, ejecutar_local
+from .muestreo import separar_medidas, ejecutar_distribucion
+from .perfilado import PerfilDisparos, perfil_disparos
+from .asincrono import ejecutar_programa_async
+from .lote import ejecutar_lote, cerrar_ejecutores
+from .ruido import (
+    matriz_confusion,
+    aplicar_ruido_lectura,
+    probabilidad_relajacion,
+    aplicar_ruido_t1,
+    aplicar_en_flujo,
+    aplicar_ruido_t1_en_flujo
+)
+from .decodificacion import bits_a_enteros, histograma
+from .entropia import PoolEntropia
+from .ruleta import tabla_ganadoras, simular_partidas, resumir_partidas
+from .tabla_verdad import permutacion, tabla_verdad, imprimir_tabla_verdad
+from .registro_puertas import RegistroPuertas, registro_global
+from .paso_a_paso import SimuladorIncremental, wavefunction_incremental
+from .dinamico import es_dinamico, ejecutar_dinamico, ejecutar_en_proceso
+from .flujo import ejecutar_en_flujo, Conteos, Marginales, MediaVarianza, reducir
+from .empaquetado import (
+    RegistroEmpaquetado, Empaquetador, empaquetar_mapa, desempaquetar_mapa, guardar_resultados,
+    cargar_resultados
+)
+from .puntuacion import (
+    TABLA_DOS_JUGADORES, TABLA_TRES_JUGADORES, tabla_desde_regla, analizar_partidas, prueba_binomial,
+    detectar_trampas
+)
+from .densidad import (
+    ModeloRuido, matriz_densidad, distribucion_ruidosa, probabilidades_registro, ejecutar_densidad
+)
+from .trayectorias import evolucionar_trayectorias, ejecutar_trayectorias
+from .estabilizador import Tableau, CircuitoClifford, es_clifford, ejecutar_estabilizador
+from .optimizacion import (
+    eliminar_identidades, cancelar_inversos, reconocer_swaps, fusionar_1q, optimizar_programa,
+    imprimir_informe, contar_puertas, profundidad
+)
 
 __all__ = [
     'crear_programa_base',
     'ejecutar_programa',
     'medir_qubits',
-    'interpretar_resultado_binario'
+    'interpretar_resultado_binario',
+    'PoolQC',
+    'pool_global',
+    'CacheCompilacion',
+    'cache_global',
+    'compilar',
+    'CircuitoLocal',
+    'estado_final',
+    'matriz_unitaria',
+    'ejecutar_local',
+    'separar_medidas',
+    'ejecutar_distribucion',
+    'PerfilDisparos',
+    'perfil_disparos',
+    'ejecutar_programa_async',
+    'ejecutar_lote',
+    'cerrar_ejecutores',
+    'matriz_confusion',
+    'aplicar_ruido_lectura',
+    'probabilidad_relajacion',
+    'aplicar_ruido_t1',
+    'aplicar_en_flujo',
+    'aplicar_ruido_t1_en_flujo',
+    'bits_a_enteros',
+    'histograma',
+    'PoolEntropia',
+    'tabla_ganadoras',
+    'simular_partidas',
+    'resumir_partidas',
+    'permutacion',
+    'tabla_verdad',
+    'imprimir_tabla_verdad',
+    'RegistroPuertas',
+    'registro_global',
+    'SimuladorIncremental',
+    'wavefunction_incremental',
+    'es_dinamico',
+    'ejecutar_dinamico',
+    'ejecutar_en_proceso',
+    'ejecutar_en_flujo',
+    'Conteos',
+    'Marginales',
+    'MediaVarianza',
+    'reducir',
+    'RegistroEmpaquetado',
+    'Empaquetador',
+    'empaquetar_mapa',
+    'desempaquetar_mapa',
+    'guardar_resultados',
+    'cargar_resultados',
+    'TABLA_DOS_JUGADORES',
+    'TABLA_TRES_JUGADORES',
+    'tabla_desde_regla',
+    'analizar_partidas',
+    'prueba_binomial',
+    'detectar_trampas',
+    'ModeloRuido',
+    'matriz_densidad',
+    'distribucion_ruidosa',
+    'probabilidades_registro',
+    'ejecutar_densidad',
+    'evolucionar_trayectorias',
+    'ejecutar_trayectorias',
+    'Tableau',
+    'CircuitoClifford',
+    'es_clifford',
+    'ejecutar_estabilizador',
+    'eliminar_identidades',
+    'cancelar_inversos',
+    'reconocer_swaps',
+    'fusionar_1q',
+    'optimizar_programa',
+    'imprimir_informe',
+    'contar_puertas',
+    'profundidad'
 ]
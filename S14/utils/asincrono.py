@@ -0,0 +1,143 @@
+import asyncio
+import weakref
+
+from pyquil.api import QVM
+from pyquil.api._qvm import QVMExecuteResponse
+from qcs_sdk import qvm
+from qcs_sdk.qvm import QVMOptions
+
+from .cache_compilacion import compilar
+from .dinamico import ejecutar_en_proceso
+from .estabilizador import ejecutar_estabilizador, es_clifford
+from .perfilado import registrar_ejecucion
+from .pool_qc import pool_global
+
+
+LIMITE_CONEXIONES = 8
+
+_semaforos = weakref.WeakKeyDictionary()
+
+
+def _semaforo(limite):
+    # Un semáforo por bucle de eventos: asyncio no permite compartirlos
+    bucle = asyncio.get_running_loop()
+    semaforos = _semaforos.setdefault(bucle, {})
+    if limite not in semaforos:
+        semaforos[limite] = asyncio.Semaphore(limite)
+    return semaforos[limite]
+
+
+async def _run_qvm(prestamo, ejecutable):
+    qc = prestamo.qc
+    qam = qc.qam
+
+    if not isinstance(qam, QVM) or qam.noise_model is not None:
+        # qc.run ya se registra en el perfil (perfilado parchea QuantumComputer.run)
+        result = await prestamo.en_hilo(qc.run, ejecutable)
+        return result.get_register_map()
+
+    # Misma petición que QVM.execute, pero sin bloquear el bucle de eventos
+    registrar_ejecucion(ejecutable.num_shots)
+    direcciones = {nombre: qvm.api.AddressRequest.include_all() for nombre in ejecutable.declarations}
+    datos = await qvm.run_async(
+        ejecutable.out(calibrations=False),
+        ejecutable.num_shots,
+        direcciones,
+        {},
+        qam._client,
+        qam.measurement_noise,
+        qam.gate_noise,
+        qam.random_seed,
+        options=QVMOptions(timeout_seconds=qam.timeout),
+    )
+    respuesta = QVMExecuteResponse(executable=ejecutable, data=datos)
+    return qam.get_result(respuesta).get_register_map()
+
+
+async def _adquirir(qvm_name, noisy):
+    """pool_global.adquirir en un hilo; si se cancela la espera, el qc vuelve al pool al llegar"""
+    tarea = asyncio.ensure_future(asyncio.to_thread(pool_global.adquirir, qvm_name, noisy))
+    try:
+        return await asyncio.shield(tarea)
+    except asyncio.CancelledError:
+        def devolver(t):
+            if not t.cancelled() and t.exception() is None:
+                pool_global.liberar(t.result(), qvm_name, noisy)
+        tarea.add_done_callback(devolver)
+        raise
+
+
+class _Prestamo:
+    """
+    Un hueco del semáforo y un QuantumComputer del pool. Si la tarea se
+    cancela mientras un hilo los usa, se devuelven cuando ese hilo termina.
+    """
+
+    def __init__(self, semaforo, qvm_name, noisy):
+        self.semaforo = semaforo
+        self.qvm_name = qvm_name
+        self.noisy = noisy
+        self.qc = None
+        self.hilo = None
+
+    async def __aenter__(self):
+        await self.semaforo.acquire()
+        try:
+            self.qc = await _adquirir(self.qvm_name, self.noisy)
+        except BaseException:
+            self.semaforo.release()
+            raise
+        return self
+
+    async def __aexit__(self, *exc):
+        if self.hilo is not None and not self.hilo.done():
+            self.hilo.add_done_callback(self._devolver)
+        else:
+            self._devolver()
+
+    def _devolver(self, hilo=None):
+        if hilo is not None and not hilo.cancelled():
+            hilo.exception()  # Nadie espera ya el resultado
+        pool_global.liberar(self.qc, self.qvm_name, self.noisy)
+        self.semaforo.release()
+
+    async def en_hilo(self, funcion, *args):
+        """funcion(*args) en un hilo; cancelar la espera no la interrumpe"""
+        self.hilo = asyncio.ensure_future(asyncio.to_thread(funcion, *args))
+        return await asyncio.shield(self.hilo)
+
+
+async def ejecutar_programa_async(program, num_shots=1, qvm_name='9q-square-qvm', noisy=False,
+                                  backend="auto", limite_conexiones=LIMITE_CONEXIONES):
+    """
+    Versión asyncio de ejecutar_programa.
+
+    Como mucho limite_conexiones trabajos usan a la vez el qvm/quilc; el
+    resto espera en el semáforo (contrapresión). Cancelar la tarea libera
+    su hueco y su QuantumComputer, en cuanto ningún hilo los esté usando.
+
+    backend="auto" usa el simulador de estabilizadores si el programa es
+    Clifford y sin ruido, y el qvm si no.
+    """
+    program_wrapped = program.copy().wrap_in_numshots_loop(num_shots)
+
+    if backend == "auto":
+        backend = "estabilizador" if not noisy and es_clifford(program) else "qvm"
+
+    if backend in ("local", "estabilizador"):
+        if noisy:
+            raise ValueError(f"El backend {backend} no simula ruido: usa backend=\"qvm\" con noisy=True")
+        simular = ejecutar_en_proceso if backend == "local" else ejecutar_estabilizador
+        # La simulación es bloqueante: en un hilo, para no parar el resto de corrutinas
+        async with _semaforo(limite_conexiones):
+            registros = await asyncio.to_thread(simular, program_wrapped)
+        return registros.get("ro")
+    if backend != "qvm":
+        raise ValueError(f"Backend desconocido: {backend}")
+
+    # get_qc y quilc son bloqueantes: fuera del bucle de eventos
+    async with _Prestamo(_semaforo(limite_conexiones), qvm_name, noisy) as prestamo:
+        ejecutable = await prestamo.en_hilo(compilar, prestamo.qc, program_wrapped)
+        registros = await _run_qvm(prestamo, ejecutable)
+
+    return registros.get("ro")
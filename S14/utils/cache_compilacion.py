@@ -0,0 +1,145 @@
+import hashlib
+import json
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+
+from pyquil import Program
+
+
+def normalizar_quil(program):
+    """Texto Quil canónico: sin comentarios, espacios sobrantes ni líneas vacías"""
+    copia = program.copy()
+    copia.resolve_placeholders()
+
+    lineas = []
+    for linea in copia.out().splitlines():
+        linea = linea.split("#", 1)[0].strip()
+        if linea:
+            lineas.append(" ".join(linea.split()))
+
+    return "\n".join(lineas)
+
+
+class CacheCompilacion:
+    """
+    Cache LRU de ejecutables compilados, indexada por Quil normalizado + ISA.
+
+    Si se indica un directorio, los ejecutables se guardan también en disco
+    como texto Quil nativo, para que un proceso nuevo arranque con la cache
+    caliente.
+    """
+
+    def __init__(self, max_entradas=256, directorio=None):
+        self.max_entradas = max_entradas
+        self.directorio = None
+        self._entradas = OrderedDict()
+        self._isas = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.aciertos = 0
+        self.aciertos_disco = 0
+        self.fallos = 0
+
+        if directorio is not None:
+            self.persistir_en(directorio)
+
+    def persistir_en(self, directorio):
+        self.directorio = Path(directorio)
+        self.directorio.mkdir(parents=True, exist_ok=True)
+
+    def _hash_isa(self, qc):
+        try:
+            return self._isas[qc]
+        except (KeyError, TypeError):
+            pass
+
+        isa = json.dumps(qc.to_compiler_isa().dict(), sort_keys=True)
+        hash_isa = hashlib.sha256(isa.encode()).hexdigest()
+        try:
+            self._isas[qc] = hash_isa
+        except TypeError:
+            pass
+        return hash_isa
+
+    def clave(self, qc, program):
+        contenido = self._hash_isa(qc) + "\n" + normalizar_quil(program)
+        return hashlib.sha256(contenido.encode()).hexdigest()
+
+    def compilar(self, qc, program):
+        clave = self.clave(qc, program)
+        ejecutable = self._buscar(clave)
+
+        if ejecutable is None:
+            ejecutable = qc.compile(program)
+            self._guardar(clave, ejecutable)
+
+        # El número de shots no forma parte de la clave
+        if isinstance(ejecutable, Program):
+            ejecutable = ejecutable.copy()
+            ejecutable.wrap_in_numshots_loop(program.num_shots)
+
+        return ejecutable
+
+    def _buscar(self, clave):
+        with self._lock:
+            if clave in self._entradas:
+                self._entradas.move_to_end(clave)
+                self.aciertos += 1
+                return self._entradas[clave]
+
+        ejecutable = self._leer_disco(clave)
+
+        with self._lock:
+            if ejecutable is None:
+                self.fallos += 1
+            else:
+                self.aciertos_disco += 1
+                self._insertar(clave, ejecutable)
+
+        return ejecutable
+
+    def _guardar(self, clave, ejecutable):
+        with self._lock:
+            self._insertar(clave, ejecutable)
+
+        if self.directorio is not None and isinstance(ejecutable, Program):
+            ruta = self.directorio / f"{clave}.quil"
+            temporal = ruta.with_suffix(".tmp")
+            temporal.write_text(ejecutable.out())
+            temporal.replace(ruta)
+
+    def _insertar(self, clave, ejecutable):
+        self._entradas[clave] = ejecutable
+        self._entradas.move_to_end(clave)
+        while len(self._entradas) > self.max_entradas:
+            self._entradas.popitem(last=False)
+
+    def _leer_disco(self, clave):
+        if self.directorio is None:
+            return None
+
+        ruta = self.directorio / f"{clave}.quil"
+        if not ruta.exists():
+            return None
+        return Program(ruta.read_text())
+
+    def vaciar(self):
+        with self._lock:
+            self._entradas.clear()
+
+    def estadisticas(self):
+        with self._lock:
+            return {
+                'aciertos': self.aciertos,
+                'aciertos_disco': self.aciertos_disco,
+                'fallos': self.fallos,
+                'entradas': len(self._entradas)
+            }
+
+
+cache_global = CacheCompilacion()
+
+
+def compilar(qc, program):
+    return cache_global.compilar(qc, program)
@@ -0,0 +1,47 @@
+"""
+Decodificación de registros de medida (shots, n) a enteros.
+
+Orden de bits:
+- "msb": la primera columna es el bit más significativo
+  (interpretar_resultado_binario, binario_a_dado del S12).
+- "lsb": la primera columna es el bit menos significativo
+  (convención de qubits de pyQuil, ruleta del S05).
+"""
+
+import numpy as np
+
+
+ORDENES = ("msb", "lsb")
+
+
+def bits_a_enteros(bits, orden="msb"):
+    """
+    Convierte todo el registro a enteros de una vez.
+
+    Acumula columna a columna con desplazamientos sobre un vector int64:
+    n pasadas vectorizadas, sin bucles por shot ni por bit.
+    """
+    if orden not in ORDENES:
+        raise ValueError(f"Orden de bits desconocido: {orden}")
+
+    bits = np.asarray(bits)
+    un_shot = bits.ndim == 1
+    bits = np.atleast_2d(bits)
+
+    num_bits = bits.shape[1]
+    if num_bits > 63:
+        raise ValueError("Como máximo 63 bits por entero")
+
+    columnas = range(num_bits) if orden == "msb" else range(num_bits - 1, -1, -1)
+    enteros = np.zeros(len(bits), dtype=np.int64)
+    for j in columnas:
+        enteros <<= 1
+        enteros |= bits[:, j]
+
+    return int(enteros[0]) if un_shot else enteros
+
+
+def histograma(bits, orden="msb"):
+    """Cuenta de cada valor 0..2^n-1 directamente desde el registro"""
+    bits = np.atleast_2d(np.asarray(bits))
+    return np.bincount(bits_a_enteros(bits, orden), minlength=2 ** bits.shape[1])
@@ -0,0 +1,177 @@
+"""
+Simulador de matriz densidad con canales de ruido durante el circuito.
+
+ρ se guarda como tensor (2,)*2n: los n primeros ejes son los del ket, con
+la misma convención que simulador_local, y los n últimos los del bra. Cada
+puerta U se aplica como U ρ U† y, después, cada qubit que toca pasa por el
+canal de ruido del modelo.
+
+Los operadores de Kraus de un canal se suman en su superoperador
+S = Σ K ⊗ K*, una matriz 4x4 que actúa sobre el par de ejes (ket, bra)
+del qubit: aplicar el canal cuesta una sola contracción, tenga los
+operadores que tenga, y varios canales seguidos se componen en uno.
+"""
+
+import numpy as np
+
+from .decodificacion import bits_a_enteros
+from .perfilado import registrar_ejecucion
+from .ruido import matriz_confusion
+from .simulador_local import CircuitoLocal, aplicar_matriz, muestrear
+
+
+PAULIS = (
+    np.array([[0, 1], [1, 0]], dtype=np.complex128),
+    np.array([[0, -1j], [1j, 0]], dtype=np.complex128),
+    np.array([[1, 0], [0, -1]], dtype=np.complex128),
+)
+
+
+def superoperador(kraus):
+    """Σ K ⊗ K*: actúa sobre el par (ket, bra) aplanado como índice 2·i + j"""
+    return sum(np.kron(K, K.conj()) for K in kraus)
+
+
+def kraus_amortiguamiento(gamma):
+    """Relajación |1⟩ -> |0⟩ con probabilidad gamma (T1)"""
+    return [
+        np.array([[1, 0], [0, np.sqrt(1 - gamma)]], dtype=np.complex128),
+        np.array([[0, np.sqrt(gamma)], [0, 0]], dtype=np.complex128),
+    ]
+
+
+def kraus_desfase(p):
+    """Inversión de fase (Z) con probabilidad p: las coherencias se multiplican por 1-2p"""
+    return [np.sqrt(1 - p) * np.eye(2, dtype=np.complex128), np.sqrt(p) * PAULIS[2]]
+
+
+def kraus_despolarizante(p):
+    """ρ -> (1-p)·ρ + p·I/2"""
+    return [np.sqrt(1 - 3 * p / 4) * np.eye(2, dtype=np.complex128)] + [np.sqrt(p / 4) * P for P in PAULIS]
+
+
+class ModeloRuido:
+    """
+    Ruido por puerta y de lectura, con los mismos nombres que los niveles
+    del S12: ModeloRuido(**{'T1': 30e-6, 'T2': 15e-6}) o
+    ModeloRuido(**{'p00': 0.95, 'p11': 0.95}).
+
+    Tras cada puerta, cada qubit implicado sufre gate_time de relajación T1
+    y del desfase puro que falta para llegar a T2 (1/Tφ = 1/T2 - 1/2T1),
+    más un canal despolarizante opcional. p00 y p11 son las fidelidades de
+    lectura de matriz_confusion.
+    """
+
+    def __init__(self, T1=None, T2=None, gate_time=200e-9, despolarizante=0.0, p00=1.0, p11=1.0):
+        if T2 is not None and T1 is not None and T2 > 2 * T1:
+            raise ValueError("T2 no puede ser mayor que 2*T1")
+        if not 0 <= despolarizante <= 1:
+            raise ValueError("La probabilidad despolarizante debe estar entre 0 y 1")
+        self.T1 = T1
+        self.T2 = T2
+        self.gate_time = gate_time
+        self.despolarizante = despolarizante
+        self.p00 = p00
+        self.p11 = p11
+
+    def canales(self):
+        """Listas de Kraus que se aplican, en orden, a cada qubit tras cada puerta"""
+        canales = []
+        tasa_desfase = 0.0
+        if self.T1 is not None:
+            canales.append(kraus_amortiguamiento(1 - np.exp(-self.gate_time / self.T1)))
+            tasa_desfase = -1 / (2 * self.T1)
+        if self.T2 is not None:
+            tasa_desfase += 1 / self.T2
+            if tasa_desfase > 0:
+                canales.append(kraus_desfase((1 - np.exp(-self.gate_time * tasa_desfase)) / 2))
+        if self.despolarizante:
+            canales.append(kraus_despolarizante(self.despolarizante))
+        return canales
+
+    def superoperador(self):
+        """Los canales compuestos en un único superoperador 4x4, o None si no hay ruido de puerta"""
+        total = None
+        for kraus in self.canales():
+            actual = superoperador(kraus)
+            total = actual if total is None else actual @ total
+        return total
+
+    def confusion(self):
+        if self.p00 == 1 and self.p11 == 1:
+            return None
+        return matriz_confusion(self.p00, self.p11)
+
+
+def evolucionar_densidad(circuito, ruido=None):
+    """ρ final como tensor (2,)*2n a partir de un CircuitoLocal"""
+    n = circuito.num_qubits
+    estado = circuito.estado_inicial()
+    rho = np.multiply.outer(estado, estado.conj())
+
+    canal = ruido.superoperador() if ruido is not None else None
+    for matriz, ejes in circuito.operaciones:
+        rho = aplicar_matriz(rho, matriz, ejes)
+        rho = aplicar_matriz(rho, matriz.conj(), [eje + n for eje in ejes])
+        if canal is not None:
+            for eje in ejes:
+                rho = aplicar_matriz(rho, canal, [eje, eje + n])
+    return rho
+
+
+def matriz_densidad(program, ruido=None, memoria=None):
+    """ρ (2^n, 2^n) con el orden de amplitudes de WavefunctionSimulator"""
+    circuito = CircuitoLocal(program, memoria)
+    dim = 2 ** circuito.num_qubits
+    return evolucionar_densidad(circuito, ruido).reshape(dim, dim)
+
+
+def mezclar_lectura(probabilidades, circuito, ruido):
+    """Aplica a una distribución sobre la base el error de lectura de cada qubit medido"""
+    confusion = ruido.confusion() if ruido is not None else None
+    if confusion is None:
+        return probabilidades
+
+    probabilidades = probabilidades.reshape((2,) * circuito.num_qubits)
+    for qubit in {qubit for qubit, _, _ in circuito.medidas}:
+        probabilidades = aplicar_matriz(probabilidades, confusion, [circuito.eje(qubit)])
+    return probabilidades.reshape(-1)
+
+
+def distribucion_registro(circuito, probabilidades, registro="ro", orden="msb"):
+    """Pasa una distribución sobre la base a los valores 0..2^m-1 del registro"""
+    bits = circuito.leer_medidas(np.arange(len(probabilidades)))[registro]
+    valores = bits_a_enteros(bits, orden)
+    return np.bincount(valores, weights=probabilidades, minlength=2 ** bits.shape[1])
+
+
+def _probabilidades(circuito, ruido):
+    dim = 2 ** circuito.num_qubits
+    rho = evolucionar_densidad(circuito, ruido).reshape(dim, dim)
+    return mezclar_lectura(np.clip(rho.diagonal().real, 0, None), circuito, ruido)
+
+
+def distribucion_ruidosa(program, ruido=None, memoria=None):
+    """Probabilidad exacta de cada estado de la base, lectura incluida"""
+    return _probabilidades(CircuitoLocal(program, memoria), ruido)
+
+
+def probabilidades_registro(program, ruido=None, memoria=None, registro="ro", orden="msb"):
+    """
+    Probabilidad exacta de cada valor 0..2^m-1 del registro, decodificado
+    como en decodificacion.bits_a_enteros: la distribución ruidosa en una
+    sola pasada, sin muestrear shots.
+    """
+    circuito = CircuitoLocal(program, memoria)
+    return distribucion_registro(circuito, _probabilidades(circuito, ruido), registro, orden)
+
+
+def ejecutar_densidad(program, num_shots=None, ruido=None, memoria=None, semilla=None):
+    """Como ejecutar_local, muestreando la distribución ruidosa exacta"""
+    if num_shots is None:
+        num_shots = program.num_shots
+    registrar_ejecucion(num_shots)
+
+    circuito = CircuitoLocal(program, memoria)
+    indices = muestrear(_probabilidades(circuito, ruido), num_shots, np.random.default_rng(semilla))
+    return circuito.leer_medidas(indices)
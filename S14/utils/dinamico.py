@@ -0,0 +1,171 @@
+"""
+Ejecución local de circuitos dinámicos: medidas a mitad de circuito,
+RESET y saltos condicionales (Program.if_then, JUMP-WHEN/JUMP-UNLESS).
+
+Los shots se agrupan por rama: todos los de una rama comparten estado
+cuántico y memoria clásica. Cada medida reparte la rama entre sus dos
+resultados con un único sorteo vectorizado, así que el coste crece con el
+número de ramas distintas y no con el de shots.
+"""
+
+import numpy as np
+from pyquil.quilatom import Expression, MemoryReference, _contained_mrefs
+from pyquil.quilbase import (
+    Declare, Gate, Halt, Jump, JumpTarget, JumpUnless, JumpWhen, Measurement, Pragma, ResetQubit
+)
+
+from .perfilado import registrar_ejecucion
+from .simulador_local import aplicar_matriz, ejecutar_local, matriz_puerta, reservar_memoria
+
+
+SALTOS = (Jump, JumpWhen, JumpUnless)
+MAX_PASOS = 100_000
+
+
+def es_dinamico(program):
+    """True si el programa tiene saltos, RESET o puertas sobre qubits ya medidos"""
+    medidos = set()
+    for instr in program.instructions:
+        if isinstance(instr, SALTOS + (ResetQubit,)):
+            return True
+        if isinstance(instr, Measurement):
+            medidos.add(instr.qubit.index)
+        elif isinstance(instr, Gate) and medidos.intersection(q.index for q in instr.qubits):
+            return True
+    return False
+
+
+def _referencias(gate, regiones):
+    """Posiciones de memoria de las regiones dadas que leen los parámetros de la puerta"""
+    referencias = set()
+    for parametro in gate.params:
+        if isinstance(parametro, MemoryReference):
+            referencias.add(parametro)
+        elif isinstance(parametro, Expression):
+            referencias.update(_contained_mrefs(parametro))
+    return sorted((r.name, r.offset) for r in referencias if r.name in regiones)
+
+
+def _colapsar(estado, eje, resultado, probabilidad, destino=None):
+    """Proyecta el qubit del eje sobre `resultado`; con destino, lo deja en ese valor (RESET)"""
+    origen = [slice(None)] * estado.ndim
+    origen[eje] = resultado
+    final = list(origen)
+    final[eje] = resultado if destino is None else destino
+
+    proyectado = np.zeros_like(estado)
+    proyectado[tuple(final)] = estado[tuple(origen)] / np.sqrt(probabilidad)
+    return proyectado
+
+
+def ejecutar_dinamico(program, num_shots=None, memoria=None, semilla=None):
+    """
+    Ejecuta en proceso un programa con control clásico y devuelve el mapa
+    de registros, como ejecutar_local.
+
+    Los parámetros de las puertas que leen regiones escritas por medidas
+    (RX(pi*ro[0]) tras MEASURE 0 ro[0]) se evalúan con la memoria de cada rama.
+    """
+    if num_shots is None:
+        num_shots = program.num_shots
+    registrar_ejecucion(num_shots)
+
+    program = program.copy()
+    program.resolve_placeholders()
+    instrucciones = [i for i in program.instructions if not isinstance(i, Declare)]
+    etiquetas = {
+        instr.label.name: pc for pc, instr in enumerate(instrucciones) if isinstance(instr, JumpTarget)
+    }
+
+    qubits = sorted(program.get_qubit_indices())
+    num_qubits = len(qubits)
+    ejes = {q: num_qubits - 1 - i for i, q in enumerate(qubits)}
+    definiciones = {d.name: d for d in program.defined_gates}
+    memoria = memoria or {}
+
+    declarados = {nombre: (d.memory_type, d.memory_size) for nombre, d in program.declarations.items()}
+    registros = reservar_memoria(declarados, num_shots)
+    if num_shots == 0:
+        return registros
+    memoria_inicial = {nombre: valores[0].copy() for nombre, valores in registros.items()}
+    memoria_inicial.update({nombre: np.asarray(valores) for nombre, valores in memoria.items()})
+
+    # La matriz de cada puerta depende solo de los valores medidos que lee: se guarda por (pc, valores)
+    medidas = {
+        instr.classical_reg.name for instr in instrucciones
+        if isinstance(instr, Measurement) and instr.classical_reg is not None
+    }
+    referencias = {}
+    operaciones = {}
+
+    def operacion(pc, gate, mem):
+        if pc not in referencias:
+            referencias[pc] = _referencias(gate, medidas)
+        clave = (pc,) + tuple(mem[nombre][offset] for nombre, offset in referencias[pc])
+        if clave not in operaciones:
+            operaciones[clave] = (matriz_puerta(gate, definiciones, mem), [ejes[q.index] for q in gate.qubits])
+        return operaciones[clave]
+
+    rng = np.random.default_rng(semilla)
+    estado = np.zeros((2,) * num_qubits, dtype=np.complex128)
+    estado[(0,) * num_qubits] = 1
+    pendientes = [(0, estado, np.arange(num_shots), memoria_inicial)]
+
+    while pendientes:
+        pc, estado, shots, mem = pendientes.pop()
+        pasos = 0
+
+        while pc < len(instrucciones):
+            pasos += 1
+            if pasos > MAX_PASOS:
+                raise RuntimeError("Demasiados pasos en una rama: ¿bucle sin salida?")
+
+            instr = instrucciones[pc]
+            if isinstance(instr, Gate):
+                estado = aplicar_matriz(estado, *operacion(pc, instr, mem))
+                pc += 1
+            elif isinstance(instr, (Measurement, ResetQubit)):
+                eje = ejes[instr.qubit.index]
+                p1 = float(np.sum(np.abs(np.take(estado, 1, axis=eje)) ** 2))
+                unos = rng.random(len(shots)) < p1
+
+                ramas = []
+                for resultado, mascara, probabilidad in ((0, ~unos, 1 - p1), (1, unos, p1)):
+                    if not mascara.any():
+                        continue
+                    destino = 0 if isinstance(instr, ResetQubit) else None
+                    nuevo = _colapsar(estado, eje, resultado, probabilidad, destino)
+                    mem_rama = mem
+                    if isinstance(instr, Measurement) and instr.classical_reg is not None:
+                        ref = instr.classical_reg
+                        mem_rama = {**mem, ref.name: mem[ref.name].copy()}
+                        mem_rama[ref.name][ref.offset] = resultado
+                    ramas.append((pc + 1, nuevo, shots[mascara], mem_rama))
+
+                (pc, estado, shots, mem), otras = ramas[0], ramas[1:]
+                pendientes.extend(otras)
+            elif isinstance(instr, (JumpWhen, JumpUnless)):
+                condicion = mem[instr.condition.name][instr.condition.offset] != 0
+                if condicion == isinstance(instr, JumpWhen):
+                    pc = etiquetas[instr.target.name]
+                else:
+                    pc += 1
+            elif isinstance(instr, Jump):
+                pc = etiquetas[instr.target.name]
+            elif isinstance(instr, Halt):
+                break
+            elif isinstance(instr, (JumpTarget, Pragma)):
+                pc += 1
+            else:
+                raise ValueError(f"Instrucción no soportada en el simulador dinámico: {instr}")
+
+        for nombre in registros:
+            registros[nombre][shots] = mem[nombre]
+
+    return registros
+
+
+def ejecutar_en_proceso(program, num_shots=None, memoria=None, semilla=None):
+    """ejecutar_local para circuitos estáticos, ejecutar_dinamico si hay control clásico"""
+    ejecutar = ejecutar_dinamico if es_dinamico(program) else ejecutar_local
+    return ejecutar(program, num_shots, memoria=memoria, semilla=semilla)
@@ -0,0 +1,187 @@
+"""
+Registros de medida empaquetados a un bit por resultado.
+
+get_register_map() devuelve un entero (int8 o int64) por bit medido; con
+np.packbits cada shot ocupa ceil(n/8) bytes. La columna j del registro es
+el bit j % 8 (orden "little") del byte j // 8 de cada fila.
+
+Los histogramas y marginales se calculan byte a byte sobre los datos
+empaquetados, por bloques de filas: funcionan igual sobre un archivo
+abierto con memmap que no cabría desempaquetado en memoria.
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+from .decodificacion import ORDENES
+from .ruido import FILAS_POR_BLOQUE
+
+
+FORMATO = 1
+ORDEN_BITS = "little"
+
+_BYTES = np.arange(256, dtype=np.uint8)
+BITS_POR_BYTE = np.unpackbits(_BYTES[:, None], axis=1, bitorder=ORDEN_BITS)
+BYTE_INVERTIDO = np.packbits(BITS_POR_BYTE, axis=1, bitorder="big").reshape(-1)
+
+
+class RegistroEmpaquetado:
+    """Registro (shots, num_bits) de ceros y unos guardado con packbits"""
+
+    def __init__(self, datos, num_bits, dtype="int8"):
+        if datos.ndim != 2 or datos.shape[1] != -(-num_bits // 8):
+            raise ValueError("Los datos no corresponden a num_bits columnas empaquetadas")
+        self.datos = datos
+        self.num_bits = num_bits
+        self.dtype = np.dtype(dtype)
+
+    @classmethod
+    def desde_bits(cls, bits):
+        bits = np.atleast_2d(np.asarray(bits))
+        if bits.size and (bits.min() < 0 or bits.max() > 1):
+            raise ValueError("Solo se pueden empaquetar registros de ceros y unos")
+        datos = np.packbits(bits.astype(np.uint8), axis=1, bitorder=ORDEN_BITS)
+        return cls(datos, bits.shape[1], bits.dtype)
+
+    @property
+    def num_shots(self):
+        return len(self.datos)
+
+    @property
+    def shape(self):
+        return (self.num_shots, self.num_bits)
+
+    def __len__(self):
+        return self.num_shots
+
+    def bits(self, inicio=0, fin=None):
+        """Desempaqueta las filas [inicio, fin) con el dtype original"""
+        bloque = np.unpackbits(self.datos[inicio:fin], axis=1, count=self.num_bits, bitorder=ORDEN_BITS)
+        return bloque.astype(self.dtype, copy=False)
+
+    def bloques(self, tam_bloque=FILAS_POR_BLOQUE):
+        """Generador de bloques desempaquetados, compatible con flujo.reducir"""
+        for inicio in range(0, self.num_shots, tam_bloque):
+            yield self.bits(inicio, inicio + tam_bloque)
+
+    def enteros(self, orden="msb", inicio=0, fin=None):
+        """Como decodificacion.bits_a_enteros, combinando bytes en vez de bits"""
+        if orden not in ORDENES:
+            raise ValueError(f"Orden de bits desconocido: {orden}")
+        if self.num_bits > 63:
+            raise ValueError("Como máximo 63 bits por entero")
+
+        datos = self.datos[inicio:fin]
+        num_bytes = datos.shape[1]
+        enteros = np.zeros(len(datos), dtype=np.uint64)
+        if orden == "lsb":
+            for j in range(num_bytes - 1, -1, -1):
+                enteros <<= np.uint64(8)
+                enteros |= datos[:, j]
+        else:
+            # Con los bits de cada byte invertidos, la fila entera es el valor msb más el relleno
+            for j in range(num_bytes):
+                enteros <<= np.uint64(8)
+                enteros |= BYTE_INVERTIDO[datos[:, j]]
+            enteros >>= np.uint64(8 * num_bytes - self.num_bits)
+        return enteros.astype(np.int64)
+
+    def histograma(self, orden="msb", tam_bloque=FILAS_POR_BLOQUE):
+        conteos = np.zeros(2 ** self.num_bits, dtype=np.int64)
+        for inicio in range(0, self.num_shots, tam_bloque):
+            conteos += np.bincount(self.enteros(orden, inicio, inicio + tam_bloque), minlength=len(conteos))
+        return conteos
+
+    def marginales(self, tam_bloque=FILAS_POR_BLOQUE):
+        """Probabilidad de 1 por columna a partir de la frecuencia de cada valor de byte"""
+        if not self.num_shots:
+            return None
+        frecuencias = np.zeros((self.datos.shape[1], 256), dtype=np.int64)
+        for inicio in range(0, self.num_shots, tam_bloque):
+            for j, columna in enumerate(self.datos[inicio:inicio + tam_bloque].T):
+                frecuencias[j] += np.bincount(columna, minlength=256)
+        unos = (frecuencias @ BITS_POR_BYTE).reshape(-1)[:self.num_bits]
+        return unos / self.num_shots
+
+
+def empaquetar_mapa(mapa):
+    """
+    Registro de get_register_map() (o dict nombre -> array) empaquetado.
+
+    Los registros con valores distintos de 0 y 1 (OCTET, INTEGER) se
+    guardan tal cual para que la conversión no pierda información.
+    """
+    empaquetados = {}
+    for nombre, valores in mapa.items():
+        valores = np.asarray(valores)
+        if valores.size and (valores.min() < 0 or valores.max() > 1):
+            empaquetados[nombre] = valores
+        else:
+            empaquetados[nombre] = RegistroEmpaquetado.desde_bits(valores)
+    return empaquetados
+
+
+def desempaquetar_mapa(empaquetados):
+    return {
+        nombre: registro.bits() if isinstance(registro, RegistroEmpaquetado) else np.asarray(registro)
+        for nombre, registro in empaquetados.items()
+    }
+
+
+def guardar_resultados(empaquetados, directorio):
+    """Un .npy por registro y metadatos.json con forma, dtype y orden de bits"""
+    directorio = Path(directorio)
+    directorio.mkdir(parents=True, exist_ok=True)
+
+    metadatos = {'formato': FORMATO, 'orden_bits': ORDEN_BITS, 'registros': {}}
+    for nombre, registro in empaquetados.items():
+        if isinstance(registro, RegistroEmpaquetado):
+            np.save(directorio / f"{nombre}.npy", registro.datos)
+            metadatos['registros'][nombre] = {
+                'empaquetado': True, 'num_shots': registro.num_shots,
+                'num_bits': registro.num_bits, 'dtype': registro.dtype.str
+            }
+        else:
+            registro = np.asarray(registro)
+            np.save(directorio / f"{nombre}.npy", registro)
+            metadatos['registros'][nombre] = {'empaquetado': False, 'dtype': registro.dtype.str}
+
+    (directorio / "metadatos.json").write_text(json.dumps(metadatos, indent=2))
+
+
+def cargar_resultados(directorio, mmap=True):
+    """Lee lo escrito por guardar_resultados(); con mmap los datos se leen del disco bajo demanda"""
+    directorio = Path(directorio)
+    metadatos = json.loads((directorio / "metadatos.json").read_text())
+    if metadatos.get('formato') != FORMATO or metadatos.get('orden_bits') != ORDEN_BITS:
+        raise ValueError(f"Formato de resultados no soportado en {directorio}")
+
+    empaquetados = {}
+    for nombre, info in metadatos['registros'].items():
+        datos = np.load(directorio / f"{nombre}.npy", mmap_mode="r" if mmap else None)
+        if info['empaquetado']:
+            empaquetados[nombre] = RegistroEmpaquetado(datos, info['num_bits'], info['dtype'])
+        else:
+            empaquetados[nombre] = datos
+    return empaquetados
+
+
+class Empaquetador:
+    """Reductor para flujo.reducir: acumula los bloques ya empaquetados"""
+
+    def __init__(self):
+        self.partes = []
+        self.num_bits = None
+        self.dtype = None
+
+    def actualizar(self, bloque):
+        registro = RegistroEmpaquetado.desde_bits(bloque)
+        self.num_bits, self.dtype = registro.num_bits, registro.dtype
+        self.partes.append(registro.datos)
+
+    def resultado(self):
+        if not self.partes:
+            return None
+        return RegistroEmpaquetado(np.concatenate(self.partes), self.num_bits, self.dtype)
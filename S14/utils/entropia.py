@@ -0,0 +1,139 @@
+import threading
+
+import numpy as np
+
+from .decodificacion import bits_a_enteros
+from .quantum_utils import crear_programa_base, ejecutar_programa, medir_qubits
+
+
+def parametros_rechazo(n):
+    """
+    Bits por candidato y límite de aceptación para enteros en [0, n).
+
+    Se aceptan candidatos < limite (el mayor múltiplo de n que cabe en k
+    bits) y se reducen módulo n. Se elige el k que gasta menos bits por
+    entero aceptado: para n=37, 7 bits aceptan el 87% frente al 58% con 6.
+    """
+    minimo = (n - 1).bit_length()
+
+    def coste(k):
+        return k * 2 ** k / (2 ** k // n * n)
+
+    k = min(range(minimo, min(minimo + 8, 63) + 1), key=coste)
+    return k, 2 ** k // n * n
+
+
+class PoolEntropia:
+    """
+    Reserva de bits aleatorios cuánticos muestreados por lotes.
+
+    Cada recarga es una sola ejecución de num_qubits Hadamard con
+    shots_por_lote shots. Cuando quedan menos de fraccion_recarga de un
+    lote, se pide el siguiente en segundo plano. entero(n) sirve valores
+    ya filtrados de una cola por rango, en O(1) amortizado.
+    """
+
+    def __init__(self, num_qubits=6, shots_por_lote=4096, backend="qvm", qvm_name=None,
+                 fraccion_recarga=0.25, valores_por_rango=1024, fuente=None):
+        self.num_qubits = num_qubits
+        self.shots_por_lote = shots_por_lote
+        self.backend = backend
+        self.qvm_name = qvm_name or f"{num_qubits}q-qvm"
+        self.bits_por_lote = num_qubits * shots_por_lote
+        self.minimo = int(self.bits_por_lote * fraccion_recarga)
+        self.valores_por_rango = valores_por_rango
+        self._fuente = fuente or self._muestrear
+
+        self._bits = np.empty(0, dtype=np.int8)
+        self._condicion = threading.Condition()
+        self._recargando = False
+        self._error = None
+        self._valores = {}
+        self.lotes = 0
+        self.bits_consumidos = 0
+        self.bits_descartados = 0
+
+    def _muestrear(self):
+        program = medir_qubits(crear_programa_base(self.num_qubits), list(range(self.num_qubits)))
+        return ejecutar_programa(program, self.shots_por_lote, self.qvm_name, backend=self.backend)
+
+    def _recargar(self):
+        nuevos, error = None, None
+        try:
+            nuevos = np.asarray(self._fuente(), dtype=np.int8).ravel()
+        except Exception as e:
+            error = e
+
+        with self._condicion:
+            if nuevos is not None:
+                self._bits = np.concatenate([self._bits, nuevos])
+                self.lotes += 1
+            self._error = error
+            self._recargando = False
+            self._condicion.notify_all()
+
+    def _pedir_recarga(self):
+        # Llamar con la condición adquirida
+        if not self._recargando:
+            self._recargando = True
+            threading.Thread(target=self._recargar, daemon=True).start()
+
+    def bits(self, cantidad):
+        """Los siguientes `cantidad` bits de la reserva; espera a la recarga si no hay suficientes"""
+        with self._condicion:
+            while len(self._bits) < cantidad:
+                self._pedir_recarga()
+                self._condicion.wait()
+                if self._error is not None:
+                    error, self._error = self._error, None
+                    raise error
+
+            tomados, self._bits = self._bits[:cantidad], self._bits[cantidad:]
+            self.bits_consumidos += cantidad
+            if len(self._bits) < self.minimo:
+                self._pedir_recarga()
+            return tomados
+
+    def enteros(self, n, cantidad):
+        """Array de `cantidad` enteros uniformes en [0, n) con rechazo vectorizado"""
+        if n < 1:
+            raise ValueError("El rango debe contener al menos un valor")
+        if n == 1:
+            return np.zeros(cantidad, dtype=np.int64)
+
+        k, limite = parametros_rechazo(n)
+        resultado = np.empty(cantidad, dtype=np.int64)
+        llenos = 0
+
+        while llenos < cantidad:
+            # Candidatos suficientes para la tasa de aceptación esperada
+            candidatos = int((cantidad - llenos) * 2 ** k / limite) + 1
+            valores = bits_a_enteros(self.bits(candidatos * k).reshape(candidatos, k), orden="lsb")
+            aceptados = valores[valores < limite] % n
+
+            tomar = min(len(aceptados), cantidad - llenos)
+            self.bits_descartados += (candidatos - tomar) * k
+            resultado[llenos:llenos + tomar] = aceptados[:tomar]
+            llenos += tomar
+
+        return resultado
+
+    def entero(self, n):
+        """Un entero uniforme en [0, n)"""
+        valores, posicion = self._valores.get(n, (None, 0))
+        if valores is None or posicion == len(valores):
+            valores, posicion = self.enteros(n, self.valores_por_rango), 0
+
+        self._valores[n] = (valores, posicion + 1)
+        return int(valores[posicion])
+
+    def estadisticas(self):
+        with self._condicion:
+            return {
+                'lotes': self.lotes,
+                'bits_disponibles': len(self._bits),
+                'bits_consumidos': self.bits_consumidos,
+                'bits_descartados': self.bits_descartados,
+                'tasa_rechazo': (self.bits_descartados / self.bits_consumidos) * 100
+                                if self.bits_consumidos else 0.0
+            }
@@ -0,0 +1,288 @@
+"""
+Simulador de estabilizadores (tableau de Aaronson-Gottesman) para circuitos Clifford.
+
+Los circuitos con solo H, S, X, Y, Z, CNOT, CZ y SWAP se simulan en tiempo
+polinómico: el estado es un tableau de 2n generadores de Pauli en vez de
+2^n amplitudes, así que cientos o miles de qubits no son un problema.
+
+Las filas del tableau guardan sus bits x y z empaquetados (el qubit j es
+el bit j % 8 del byte j // 8): las puertas son operaciones sobre una
+columna de bits y el producto de filas de la medida es un XOR byte a byte.
+
+Medida en bloque: los resultados posibles de medir un estado estabilizador
+en la base computacional son uniformes sobre un subespacio afín v0 + V,
+con V generado por las partes X de los estabilizadores. Se calcula v0 con
+una única medida (forzando 0 en los resultados aleatorios) y una base de
+V, y cada shot es v0 más una combinación aleatoria de esa base.
+"""
+
+import numpy as np
+from pyquil.quilbase import Declare, Gate, Halt, Measurement, Pragma
+
+from .perfilado import registrar_ejecucion
+from .simulador_local import reservar_memoria
+
+
+CLIFFORD = ("I", "H", "S", "X", "Y", "Z", "CNOT", "CZ", "SWAP")
+AUTOINVERSAS = ("I", "H", "X", "Y", "Z", "CNOT", "CZ", "SWAP")
+
+UNOS_POR_BYTE = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1)
+
+
+def _popcount(bytes_):
+    return UNOS_POR_BYTE[bytes_].sum(axis=-1, dtype=np.int64)
+
+
+class Tableau:
+    """
+    Filas 0..n-1: desestabilizadores; filas n..2n-1: estabilizadores.
+    Parte en |0...0⟩ (estabilizadores Z_j, desestabilizadores X_j).
+    """
+
+    def __init__(self, num_qubits):
+        self.num_qubits = num_qubits
+        num_bytes = max(-(-num_qubits // 8), 1)
+        self.x = np.zeros((2 * num_qubits, num_bytes), dtype=np.uint8)
+        self.z = np.zeros((2 * num_qubits, num_bytes), dtype=np.uint8)
+        self.r = np.zeros(2 * num_qubits, dtype=np.uint8)
+
+        filas = np.arange(num_qubits)
+        self.x[filas, filas >> 3] = 1 << (filas & 7)
+        self.z[filas + num_qubits, filas >> 3] = 1 << (filas & 7)
+
+    def copy(self):
+        copia = Tableau.__new__(Tableau)
+        copia.num_qubits = self.num_qubits
+        copia.x, copia.z, copia.r = self.x.copy(), self.z.copy(), self.r.copy()
+        return copia
+
+    @staticmethod
+    def _columna(matriz, qubit):
+        return (matriz[:, qubit >> 3] >> (qubit & 7)) & 1
+
+    @staticmethod
+    def _fijar(matriz, qubit, valores):
+        byte, bit = qubit >> 3, qubit & 7
+        matriz[:, byte] = (matriz[:, byte] & ~np.uint8(1 << bit)) | (valores.astype(np.uint8) << bit)
+
+    # Puertas: actualización de la columna de cada qubit y de las fases
+
+    def h(self, a):
+        xa, za = self._columna(self.x, a), self._columna(self.z, a)
+        self.r ^= xa & za
+        self._fijar(self.x, a, za)
+        self._fijar(self.z, a, xa)
+
+    def s(self, a):
+        xa, za = self._columna(self.x, a), self._columna(self.z, a)
+        self.r ^= xa & za
+        self._fijar(self.z, a, za ^ xa)
+
+    def x_(self, a):
+        self.r ^= self._columna(self.z, a)
+
+    def y(self, a):
+        self.r ^= self._columna(self.x, a) ^ self._columna(self.z, a)
+
+    def z_(self, a):
+        self.r ^= self._columna(self.x, a)
+
+    def cnot(self, a, b):
+        xa, za = self._columna(self.x, a), self._columna(self.z, a)
+        xb, zb = self._columna(self.x, b), self._columna(self.z, b)
+        self.r ^= xa & zb & (xb ^ za ^ 1)
+        self._fijar(self.x, b, xb ^ xa)
+        self._fijar(self.z, a, za ^ zb)
+
+    def cz(self, a, b):
+        self.h(b)
+        self.cnot(a, b)
+        self.h(b)
+
+    def swap(self, a, b):
+        for matriz in (self.x, self.z):
+            columna_a, columna_b = self._columna(matriz, a), self._columna(matriz, b)
+            self._fijar(matriz, a, columna_b)
+            self._fijar(matriz, b, columna_a)
+
+    def aplicar(self, nombre, qubits):
+        operaciones = {
+            "I": lambda a: None, "H": self.h, "S": self.s, "X": self.x_, "Y": self.y, "Z": self.z_,
+            "CNOT": self.cnot, "CZ": self.cz, "SWAP": self.swap
+        }
+        operaciones[nombre](*qubits)
+
+    # Medida
+
+    @staticmethod
+    def _fase(x1, z1, x2, z2):
+        """Σ g(x1, z1, x2, z2) del artículo por fila, contando por separado los términos +1 y -1"""
+        mas = (x1 & z1 & z2 & ~x2) | (x1 & ~z1 & z2 & x2) | (~x1 & z1 & x2 & ~z2)
+        menos = (x1 & z1 & x2 & ~z2) | (x1 & ~z1 & z2 & ~x2) | (~x1 & z1 & x2 & z2)
+        return _popcount(mas) - _popcount(menos)
+
+    def _multiplicar(self, filas, fuente):
+        """Multiplica las filas indicadas (todas a la vez) por la fila fuente"""
+        x1, z1 = self.x[fuente], self.z[fuente]
+        x2, z2 = self.x[filas], self.z[filas]
+        fase = 2 * self.r[filas].astype(np.int64) + 2 * int(self.r[fuente]) + self._fase(x1, z1, x2, z2)
+        self.x[filas] = x2 ^ x1
+        self.z[filas] = z2 ^ z1
+        self.r[filas] = (fase % 4) == 2
+
+    def medir(self, a, rng=None):
+        """
+        Mide el qubit a en la base Z y deja el tableau en el estado colapsado.
+        Los resultados aleatorios se sortean con rng, o valen 0 si rng es None.
+        """
+        n = self.num_qubits
+        xa = self._columna(self.x, a)
+        candidatos = np.flatnonzero(xa[n:])
+
+        if len(candidatos):
+            p = n + candidatos[0]
+            filas = np.flatnonzero(xa)
+            self._multiplicar(filas[filas != p], p)
+
+            resultado = int(rng.integers(2)) if rng is not None else 0
+            self.x[p - n], self.z[p - n], self.r[p - n] = self.x[p], self.z[p], self.r[p]
+            self.x[p] = 0
+            self.z[p] = 0
+            self.z[p, a >> 3] = 1 << (a & 7)
+            self.r[p] = resultado
+            return resultado
+
+        # Determinista: signo del producto de los estabilizadores que indican los
+        # desestabilizadores. Cada factor se multiplica por el acumulado de los
+        # anteriores (XOR prefijo) y las fases se suman módulo 4 de una vez
+        filas = np.flatnonzero(xa[:n]) + n
+        x, z = self.x[filas], self.z[filas]
+        previos_x = np.bitwise_xor.accumulate(x, axis=0)[:-1]
+        previos_z = np.bitwise_xor.accumulate(z, axis=0)[:-1]
+        fase = 2 * int(self.r[filas].sum()) + int(self._fase(x[1:], z[1:], previos_x, previos_z).sum())
+        return int(fase % 4 == 2)
+
+    def soporte(self):
+        """
+        (v0, base): los resultados de medir todos los qubits son v0 ⊕ combinaciones
+        de las filas de base, todas con la misma probabilidad. Filas empaquetadas.
+        """
+        copia = self.copy()
+        v0 = np.array([copia.medir(a) for a in range(self.num_qubits)], dtype=np.uint8)
+        v0 = np.packbits(v0, bitorder="little")
+
+        # Eliminación gaussiana sobre las partes X de los estabilizadores
+        filas = self.x[self.num_qubits:].copy()
+        base = []
+        for a in range(self.num_qubits):
+            columna = (filas[:, a >> 3] >> (a & 7)) & 1
+            pivotes = np.flatnonzero(columna)
+            if not len(pivotes):
+                continue
+            pivote = filas[pivotes[0]].copy()
+            filas[pivotes[1:]] ^= pivote
+            filas[pivotes[0]] = 0
+            base.append(pivote)
+
+        base = np.array(base, dtype=np.uint8).reshape(-1, self.x.shape[1])
+        return v0, base
+
+
+class CircuitoClifford:
+    """Programa de pyQuil traducido a puertas del tableau; mismas restricciones que CircuitoLocal"""
+
+    def __init__(self, program):
+        self.qubits = sorted(program.get_qubit_indices())
+        self.num_qubits = len(self.qubits)
+        self.registros = {}
+        self.puertas = []
+        self.medidas = []
+
+        local = {q: i for i, q in enumerate(self.qubits)}
+        medidos = set()
+
+        for instr in program.instructions:
+            if isinstance(instr, Declare):
+                self.registros[instr.name] = (instr.memory_type, instr.memory_size)
+            elif isinstance(instr, Gate):
+                indices = [local[q.index] for q in instr.qubits]
+                if medidos.intersection(indices):
+                    raise ValueError("El simulador de estabilizadores solo admite medidas al final del circuito")
+                self.puertas.extend((nombre, indices) for nombre in _descomponer(instr))
+            elif isinstance(instr, Measurement):
+                i = local[instr.qubit.index]
+                medidos.add(i)
+                if instr.classical_reg is not None:
+                    ref = instr.classical_reg
+                    self.medidas.append((i, ref.name, ref.offset))
+            elif isinstance(instr, Halt):
+                break
+            elif not isinstance(instr, Pragma):
+                raise ValueError(f"Instrucción no soportada en el simulador de estabilizadores: {instr}")
+
+    def tableau(self):
+        tableau = Tableau(self.num_qubits)
+        for nombre, qubits in self.puertas:
+            tableau.aplicar(nombre, qubits)
+        return tableau
+
+    def leer_medidas(self, resultados):
+        """Mapa de registros a partir de resultados empaquetados (shots, bytes)"""
+        registros = reservar_memoria(self.registros, len(resultados))
+        for qubit, nombre, offset in self.medidas:
+            registros[nombre][:, offset] = (resultados[:, qubit >> 3] >> (qubit & 7)) & 1
+        return registros
+
+
+def _descomponer(gate):
+    """Nombres de puertas del tableau equivalentes a gate (S† = S·S·S, CONTROLLED X = CNOT...)"""
+    if gate.params:
+        raise ValueError(f"Puerta con parámetros: {gate.name}")
+
+    nombre = gate.name
+    modificadores = list(gate.modifiers)
+    if modificadores[-1:] == ["CONTROLLED"] and nombre in ("X", "Z"):
+        modificadores.pop()
+        nombre = "CNOT" if nombre == "X" else "CZ"
+    if nombre not in CLIFFORD:
+        raise ValueError(f"Puerta no Clifford: {gate.name}")
+
+    repeticiones = 1
+    for modificador in modificadores:
+        if modificador != "DAGGER":
+            raise ValueError(f"Modificador no soportado en el simulador de estabilizadores: {modificador}")
+        if nombre not in AUTOINVERSAS:
+            repeticiones = 4 - repeticiones
+    return [nombre] * repeticiones
+
+
+def es_clifford(program):
+    """True si el programa se puede simular con el tableau (solo Clifford y medidas finales)"""
+    if program.defined_gates:
+        return False
+    try:
+        CircuitoClifford(program)
+    except ValueError:
+        return False
+    return True
+
+
+def muestrear_soporte(v0, base, num_shots, rng):
+    """num_shots resultados (empaquetados) uniformes sobre v0 + span(base)"""
+    coeficientes = rng.integers(0, 2, (num_shots, len(base)), dtype=np.uint8)
+    resultados = np.broadcast_to(v0, (num_shots, len(v0))).copy()
+    for j, fila in enumerate(base):
+        resultados ^= coeficientes[:, j, None] * fila
+    return resultados
+
+
+def ejecutar_estabilizador(program, num_shots=None, semilla=None):
+    """Ejecuta un circuito Clifford y devuelve el mapa de registros, como ejecutar_local"""
+    if num_shots is None:
+        num_shots = program.num_shots
+    registrar_ejecucion(num_shots)
+
+    circuito = CircuitoClifford(program)
+    v0, base = circuito.tableau().soporte()
+    resultados = muestrear_soporte(v0, base, num_shots, np.random.default_rng(semilla))
+    return circuito.leer_medidas(resultados)
@@ -0,0 +1,175 @@
+"""
+Ejecución por bloques para números de shots que no caben en memoria.
+
+ejecutar_en_flujo devuelve un generador de bloques (shots, n) del registro
+"ro"; los reductores los agregan sobre la marcha, así que un barrido de
+10^8 shots ocupa lo mismo que uno de un bloque:
+
+    conteos, medias = reducir(ejecutar_en_flujo(prog, 10**8, backend="local"),
+                              Conteos(), MediaVarianza())
+"""
+
+import numpy as np
+
+from .cache_compilacion import compilar
+from .decodificacion import ORDENES, bits_a_enteros
+from .dinamico import ejecutar_dinamico, es_dinamico
+from .estabilizador import CircuitoClifford, es_clifford, muestrear_soporte
+from .perfilado import registrar_ejecucion
+from .pool_qc import pool_global
+from .ruido import FILAS_POR_BLOQUE
+from .simulador_local import CircuitoLocal, muestrear
+
+
+def _tamaños(num_shots, tam_bloque):
+    for inicio in range(0, num_shots, tam_bloque):
+        yield min(tam_bloque, num_shots - inicio)
+
+
+def _flujo_local(program, num_shots, tam_bloque, semilla, registro):
+    rng = np.random.default_rng(semilla)
+
+    if es_dinamico(program):
+        for tam in _tamaños(num_shots, tam_bloque):
+            yield ejecutar_dinamico(program, tam, semilla=rng)[registro]
+        return
+
+    # Circuito estático: se simula una vez y cada bloque solo vuelve a muestrear
+    circuito = CircuitoLocal(program)
+    probabilidades = np.abs(circuito.evolucionar().reshape(-1)) ** 2
+    for tam in _tamaños(num_shots, tam_bloque):
+        registrar_ejecucion(tam)
+        yield circuito.leer_medidas(muestrear(probabilidades, tam, rng))[registro]
+
+
+def _flujo_estabilizador(circuito, num_shots, tam_bloque, semilla, registro):
+    rng = np.random.default_rng(semilla)
+    v0, base = circuito.tableau().soporte()
+    for tam in _tamaños(num_shots, tam_bloque):
+        registrar_ejecucion(tam)
+        yield circuito.leer_medidas(muestrear_soporte(v0, base, tam, rng))[registro]
+
+
+def _flujo_qvm(program, num_shots, tam_bloque, qvm_name, noisy, registro):
+    # La cache de compilación ignora num_shots: todos los bloques reutilizan el mismo compilado
+    with pool_global.usar(qvm_name, noisy) as qvm:
+        for tam in _tamaños(num_shots, tam_bloque):
+            ejecutable = compilar(qvm, program.copy().wrap_in_numshots_loop(tam))
+            yield qvm.run(ejecutable).get_register_map()[registro]
+
+
+def ejecutar_en_flujo(program, num_shots, tam_bloque=FILAS_POR_BLOQUE, qvm_name='9q-square-qvm',
+                      noisy=False, backend="auto", semilla=None, registro="ro"):
+    """
+    Generador de bloques de como mucho tam_bloque shots del registro.
+
+    Los argumentos se validan al llamar, no al pedir el primer bloque. Con
+    backend="qvm" el ordenador cuántico del pool queda reservado hasta que
+    el generador se agota o se cierra. backend="auto" usa el simulador de
+    estabilizadores si el programa es Clifford y sin ruido, y el qvm si no.
+    """
+    if tam_bloque < 1:
+        raise ValueError("tam_bloque debe ser positivo")
+    if backend == "auto":
+        backend = "estabilizador" if not noisy and es_clifford(program) else "qvm"
+    if backend == "estabilizador":
+        if noisy:
+            raise ValueError("El simulador de estabilizadores no simula ruido: "
+                             "usa backend=\"qvm\" con noisy=True")
+        return _flujo_estabilizador(CircuitoClifford(program), num_shots, tam_bloque, semilla, registro)
+    if backend == "local":
+        if noisy:
+            raise ValueError("El backend local no simula ruido: usa backend=\"qvm\" con noisy=True")
+        return _flujo_local(program, num_shots, tam_bloque, semilla, registro)
+    if backend == "qvm":
+        return _flujo_qvm(program, num_shots, tam_bloque, qvm_name, noisy, registro)
+    raise ValueError(f"Backend desconocido: {backend}")
+
+
+class Conteos:
+    """Histograma de valores 0..2^n-1 (como decodificacion.histograma)"""
+
+    def __init__(self, orden="msb"):
+        if orden not in ORDENES:
+            raise ValueError(f"Orden de bits desconocido: {orden}")
+        self.orden = orden
+        self.conteos = None
+
+    def actualizar(self, bloque):
+        parcial = np.bincount(bits_a_enteros(bloque, self.orden), minlength=2 ** bloque.shape[1])
+        if self.conteos is None:
+            self.conteos = parcial
+        else:
+            self.conteos += parcial
+
+    def resultado(self):
+        return self.conteos
+
+
+class Marginales:
+    """Probabilidad de medir 1 en cada columna del registro"""
+
+    def __init__(self):
+        self.unos = None
+        self.total = 0
+
+    def actualizar(self, bloque):
+        parcial = np.count_nonzero(bloque, axis=0)
+        self.unos = parcial if self.unos is None else self.unos + parcial
+        self.total += len(bloque)
+
+    def resultado(self):
+        if not self.total:
+            return None
+        return self.unos / self.total
+
+
+class MediaVarianza:
+    """
+    Media y varianza acumuladas (Welford, combinando bloque a bloque).
+
+    Por defecto, de cada columna del registro; con funcion, de los valores
+    que devuelva para cada bloque (p. ej. lambda b: bits_a_enteros(b) + 1).
+    La combinación de Chan evita la cancelación de sum(x²) - n·media² con
+    muchos shots.
+    """
+
+    def __init__(self, funcion=None):
+        self.funcion = funcion
+        self.n = 0
+        self.media = None
+        self.m2 = None
+
+    def actualizar(self, bloque):
+        valores = np.asarray(self.funcion(bloque) if self.funcion else bloque, dtype=np.float64)
+        n_b = len(valores)
+        if not n_b:
+            return
+        media_b = valores.mean(axis=0)
+        m2_b = ((valores - media_b) ** 2).sum(axis=0)
+
+        if self.n == 0:
+            self.n, self.media, self.m2 = n_b, media_b, m2_b
+            return
+
+        n = self.n + n_b
+        delta = media_b - self.media
+        self.media = self.media + delta * (n_b / n)
+        self.m2 = self.m2 + m2_b + delta ** 2 * (self.n * n_b / n)
+        self.n = n
+
+    def varianza(self, ddof=0):
+        if self.n <= ddof:
+            return None
+        return self.m2 / (self.n - ddof)
+
+    def resultado(self):
+        return {'shots': self.n, 'media': self.media, 'varianza': self.varianza()}
+
+
+def reducir(bloques, *reductores):
+    """Pasa cada bloque por todos los reductores y devuelve sus resultados, en orden"""
+    for bloque in bloques:
+        for reductor in reductores:
+            reductor.actualizar(bloque)
+    return tuple(reductor.resultado() for reductor in reductores)
@@ -0,0 +1,114 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+from pyquil import Program
+
+from .dinamico import ejecutar_en_proceso
+from .quantum_utils import ejecutar_programa
+from .simulador_local import tipo_numpy
+
+
+_ejecutores = {}
+_lock = threading.Lock()
+
+
+def _ejecutor_procesos(max_workers):
+    """Pool de procesos reutilizable: los workers siguen calientes entre lotes"""
+    with _lock:
+        if max_workers not in _ejecutores:
+            _ejecutores[max_workers] = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _ejecutores[max_workers]
+
+
+def cerrar_ejecutores():
+    with _lock:
+        for ejecutor in _ejecutores.values():
+            ejecutor.shutdown()
+        _ejecutores.clear()
+
+
+def _texto_quil(program):
+    copia = program.copy()
+    copia.resolve_placeholders()
+    return copia.out()
+
+
+def _formato_ro(program):
+    """(columnas, dtype) del registro "ro", según su DECLARE"""
+    declaracion = program.declarations["ro"]
+    return declaracion.memory_size, np.dtype(tipo_numpy(declaracion.memory_type))
+
+
+def _ejecutar(program, num_shots, backend, semilla):
+    if backend == "local":
+        return ejecutar_en_proceso(program, num_shots, semilla=semilla).get("ro")
+    return ejecutar_programa(program, num_shots, backend=backend)
+
+
+def _ejecutar_en_worker(quil, num_shots, backend, semilla, nombre_memoria, inicio, columnas, dtype):
+    ro = _ejecutar(Program(quil), num_shots, backend, semilla)
+
+    # El resultado va directo a la memoria compartida, sin devolver el array
+    memoria = shared_memory.SharedMemory(name=nombre_memoria)
+    try:
+        destino = np.ndarray((num_shots, columnas), dtype=dtype, buffer=memoria.buf, offset=inicio)
+        destino[:] = ro
+        del destino
+    finally:
+        memoria.close()
+
+
+def ejecutar_lote(programs, num_shots=1, executor="process", max_workers=None, backend="local",
+                  semilla=None):
+    """
+    Ejecuta varios programas en paralelo y devuelve el registro "ro" de cada uno.
+
+    executor="process" reparte los programas (como texto Quil) entre procesos
+    y recoge los resultados en un bloque de memoria compartida; sirve para
+    simulación local, que con hilos queda serializada por el GIL.
+    executor="thread" usa hilos, útil cuando se espera al qvm remoto.
+    """
+    programs = list(programs)
+    semillas = np.random.SeedSequence(semilla).spawn(len(programs))
+
+    if executor == "thread":
+        with ThreadPoolExecutor(max_workers=max_workers) as ejecutor:
+            futures = [
+                ejecutor.submit(_ejecutar, p.copy(), num_shots, backend, s)
+                for p, s in zip(programs, semillas)
+            ]
+            return [f.result() for f in futures]
+    if executor != "process":
+        raise ValueError(f"Ejecutor desconocido: {executor}")
+
+    formatos = [_formato_ro(p) for p in programs]
+    # Cada bloque empieza alineado a 8 bytes, sea cual sea el tipo del anterior
+    tamaños = [-(-num_shots * c * dtype.itemsize // 8) * 8 for c, dtype in formatos]
+    inicios = np.concatenate([[0], np.cumsum(tamaños)])
+    memoria = shared_memory.SharedMemory(create=True, size=max(int(inicios[-1]), 1))
+
+    try:
+        ejecutor = _ejecutor_procesos(max_workers)
+        futures = [
+            ejecutor.submit(_ejecutar_en_worker, _texto_quil(p), num_shots, backend, s,
+                            memoria.name, int(inicio), c, dtype)
+            for p, s, inicio, (c, dtype) in zip(programs, semillas, inicios, formatos)
+        ]
+        for f in futures:
+            f.result()
+
+        resultados = [
+            np.ndarray((num_shots, c), dtype=dtype, buffer=memoria.buf, offset=int(inicio)).copy()
+            for inicio, (c, dtype) in zip(inicios, formatos)
+        ]
+    finally:
+        memoria.close()
+        memoria.unlink()
+
+    return resultados
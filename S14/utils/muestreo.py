@@ -0,0 +1,79 @@
+import numpy as np
+from pyquil.api import WavefunctionSimulator
+from pyquil.quilbase import Declare, Gate, Halt, Measurement, Pragma
+
+from .dinamico import ejecutar_en_proceso
+from .perfilado import registrar_ejecucion
+from .pool_qc import pool_global
+from .simulador_local import muestrear, reservar_memoria
+
+
+def separar_medidas(program):
+    """
+    Separa un circuito con medidas terminales en (programa sin medidas, medidas).
+
+    Cada medida es (qubit, registro, offset). Falla si algún qubit se usa
+    después de medirse o si hay control clásico.
+    """
+    sin_medidas = program.copy_everything_except_instructions()
+    medidas = []
+    medidos = set()
+
+    for instr in program.instructions:
+        if isinstance(instr, Measurement):
+            medidos.add(instr.qubit.index)
+            if instr.classical_reg is not None:
+                ref = instr.classical_reg
+                medidas.append((instr.qubit.index, ref.name, ref.offset))
+        elif isinstance(instr, Gate):
+            if medidos.intersection(q.index for q in instr.qubits):
+                raise ValueError("El circuito no termina en medidas: no se puede muestrear en bloque")
+            sin_medidas += instr
+        elif isinstance(instr, (Declare, Pragma)):
+            sin_medidas += instr
+        elif isinstance(instr, Halt):
+            break
+        else:
+            raise ValueError(f"Instrucción no compatible con el muestreo en bloque: {instr}")
+
+    return sin_medidas, medidas
+
+
+def ejecutar_distribucion(program, num_shots=None, backend="qvm", semilla=None, qvm_name='9q-square-qvm',
+                          noisy=False):
+    """
+    Calcula la distribución de salida una sola vez y extrae todos los shots
+    de golpe: una llamada al simulador por trabajo, no una por shot.
+
+    Ni la simulación local ni la función de onda del QVM tienen ruido: con
+    noisy=True hay que usar los shots del QVM. qvm_name solo se usa para
+    comprobar que los qubits existen.
+    """
+    if num_shots is None:
+        num_shots = program.num_shots
+
+    if noisy:
+        raise ValueError("El muestreo de la distribución no tiene ruido: usa modo=\"shots\" con noisy=True")
+
+    if backend == "local":
+        return ejecutar_en_proceso(program, num_shots, semilla=semilla)
+
+    sin_medidas, medidas = separar_medidas(program)
+    with pool_global.usar(qvm_name, noisy) as qc:
+        fuera = set(program.get_qubit_indices()) - set(qc.qubits())
+    if fuera:
+        raise ValueError(f"Qubits que no existen en {qvm_name}: {sorted(fuera)}")
+    registrar_ejecucion(num_shots)
+
+    # El QVM indexa el estado por qubit físico: el bit q es el qubit q
+    probabilidades = WavefunctionSimulator().wavefunction(sin_medidas).probabilities()
+    indices = muestrear(probabilidades, num_shots, np.random.default_rng(semilla))
+
+    registros = reservar_memoria(
+        {nombre: (d.memory_type, d.memory_size) for nombre, d in program.declarations.items()},
+        num_shots
+    )
+    for qubit, nombre, offset in medidas:
+        registros[nombre][:, offset] = (indices >> qubit) & 1
+
+    return registros
@@ -0,0 +1,237 @@
+"""
+Pases de optimización sobre programas de pyQuil, antes de simular o compilar.
+
+Cada pase recibe un Program y devuelve otro equivalente. Dos puertas son
+"adyacentes" si ninguna otra instrucción toca sus qubits entre ellas: cada
+pase lleva, por qubit, la pila de instrucciones que lo han tocado. Medidas
+y RESET de un qubit cortan la adyacencia en ese qubit; pragmas, etiquetas y
+saltos la cortan en todos.
+
+    programa, informe = optimizar_programa(programa)
+    imprimir_informe(informe)
+"""
+
+import numbers
+
+import numpy as np
+from pyquil.gates import SWAP
+from pyquil.quilbase import Declare, DefGate, Gate, Pragma
+
+from .simulador_local import matriz_puerta
+
+
+AUTOINVERSAS = ("I", "X", "Y", "Z", "H", "CNOT", "CZ", "SWAP", "CCNOT", "CSWAP")
+SIMETRICAS = ("CZ", "SWAP")
+PREFIJO_FUSION = "FUSION_"
+
+
+def contar_puertas(program):
+    return sum(isinstance(instr, Gate) for instr in program.instructions)
+
+
+def profundidad(program):
+    """Número de capas de puertas: cada puerta va en la capa siguiente a la última de sus qubits"""
+    capas = {}
+    for instr in program.instructions:
+        if isinstance(instr, Gate):
+            qubits = [q.index for q in instr.qubits]
+            capa = max(capas.get(q, 0) for q in qubits) + 1
+            capas.update((q, capa) for q in qubits)
+    return max(capas.values(), default=0)
+
+
+def _reconstruir(program, instrucciones, definiciones=()):
+    nuevo = program.copy_everything_except_instructions()
+    for definicion in definiciones:
+        nuevo += definicion
+    nuevo += [instr for instr in instrucciones if instr is not None]
+    return nuevo
+
+
+class _Adyacencia:
+    """Pilas por qubit con los índices (en salida) de las instrucciones que lo tocan"""
+
+    def __init__(self):
+        self.salida = []
+        self.pilas = {}
+
+    def añadir(self, instr):
+        self.salida.append(instr)
+        indice = len(self.salida) - 1
+
+        if isinstance(instr, Declare):
+            return
+        if isinstance(instr, Gate):
+            qubits = [q.index for q in instr.qubits]
+        elif isinstance(instr, Pragma) or not hasattr(instr, "get_qubit_indices"):
+            qubits = list(self.pilas)
+        else:
+            qubits = list(instr.get_qubit_indices() or self.pilas)
+
+        for q in qubits:
+            self.pilas.setdefault(q, []).append(indice)
+
+    def previa(self, gate, nivel=1):
+        """Índice de la puerta `nivel` posiciones antes de gate en todos sus qubits, si es la misma"""
+        qubits = {q.index for q in gate.qubits}
+        indices = {
+            pila[-nivel] if len(pila) >= nivel else None
+            for pila in (self.pilas.get(q, []) for q in qubits)
+        }
+        if len(indices) != 1:
+            return None
+        indice = indices.pop()
+        if indice is None:
+            return None
+        previa = self.salida[indice]
+        if not isinstance(previa, Gate) or {q.index for q in previa.qubits} != qubits:
+            return None
+        return indice
+
+    def quitar(self, indice):
+        for q in self.salida[indice].qubits:
+            self.pilas[q.index].pop()
+        self.salida[indice] = None
+
+
+def eliminar_identidades(program):
+    instrucciones = [
+        instr for instr in program.instructions if not (isinstance(instr, Gate) and instr.name == "I")
+    ]
+    return _reconstruir(program, instrucciones)
+
+
+def _sin_dagger(modificadores):
+    return [m for m in modificadores if m != "DAGGER"]
+
+
+def son_inversas(a, b):
+    """True si b·a = I: la misma puerta autoinversa dos veces, o U seguida de U†"""
+    if a.name != b.name or a.params != b.params:
+        return False
+    qubits_a, qubits_b = [q.index for q in a.qubits], [q.index for q in b.qubits]
+    if qubits_a != qubits_b and not (a.name in SIMETRICAS and not a.modifiers and not b.modifiers
+                                     and sorted(qubits_a) == sorted(qubits_b)):
+        return False
+
+    if a.name in AUTOINVERSAS and not a.params and _sin_dagger(a.modifiers) == _sin_dagger(b.modifiers):
+        return True
+    return a.modifiers == ["DAGGER"] + b.modifiers or b.modifiers == ["DAGGER"] + a.modifiers
+
+
+def cancelar_inversos(program):
+    """Quita pares adyacentes que se anulan; en cascada (H X X H desaparece entero)"""
+    adyacencia = _Adyacencia()
+    for instr in program.instructions:
+        if isinstance(instr, Gate):
+            previa = adyacencia.previa(instr)
+            if previa is not None and son_inversas(adyacencia.salida[previa], instr):
+                adyacencia.quitar(previa)
+                continue
+        adyacencia.añadir(instr)
+    return _reconstruir(program, adyacencia.salida)
+
+
+def _es_cnot(gate):
+    return gate.name == "CNOT" and not gate.modifiers
+
+
+def reconocer_swaps(program):
+    """CNOT(a,b) CNOT(b,a) CNOT(a,b) adyacentes -> SWAP(a,b)"""
+    adyacencia = _Adyacencia()
+    for instr in program.instructions:
+        if isinstance(instr, Gate) and _es_cnot(instr):
+            segunda = adyacencia.previa(instr)
+            primera = adyacencia.previa(instr, nivel=2)
+            if segunda is not None and primera is not None:
+                a, b = (q.index for q in instr.qubits)
+                g1, g2 = adyacencia.salida[primera], adyacencia.salida[segunda]
+                if (_es_cnot(g1) and _es_cnot(g2) and [q.index for q in g1.qubits] == [a, b]
+                        and [q.index for q in g2.qubits] == [b, a]):
+                    adyacencia.quitar(segunda)
+                    adyacencia.salida[primera] = SWAP(a, b)
+                    continue
+        adyacencia.añadir(instr)
+    return _reconstruir(program, adyacencia.salida)
+
+
+def _fusionable(gate):
+    return len(gate.qubits) == 1 and all(isinstance(p, numbers.Number) for p in gate.params)
+
+
+def fusionar_1q(program):
+    """
+    Sustituye cada racha de 2 o más puertas de un qubit seguidas por un
+    DEFGATE con su producto (2x2). Si el producto es la identidad salvo
+    fase global, la racha desaparece.
+    """
+    definiciones = {d.name: d for d in program.defined_gates}
+    nuevas = {}
+    adyacencia = _Adyacencia()
+    rachas = {}
+
+    def cerrar(qubit):
+        racha = rachas.pop(qubit, None)
+        if racha is None or len(racha) < 2:
+            return
+        matriz = np.eye(2, dtype=np.complex128)
+        for indice in racha:
+            matriz = matriz_puerta(adyacencia.salida[indice], definiciones) @ matriz
+        for indice in racha[1:]:
+            adyacencia.salida[indice] = None
+
+        if np.allclose(matriz, matriz[0, 0] * np.eye(2)):
+            adyacencia.salida[racha[0]] = None
+            return
+        clave = np.round(matriz, 12).tobytes()
+        if clave not in nuevas:
+            nombre = f"{PREFIJO_FUSION}{len(nuevas)}"
+            while nombre in definiciones:
+                nombre += "_"
+            nuevas[clave] = DefGate(nombre, matriz)
+        adyacencia.salida[racha[0]] = nuevas[clave].get_constructor()(qubit)
+
+    for instr in program.instructions:
+        if isinstance(instr, Gate) and _fusionable(instr):
+            qubit = instr.qubits[0].index
+            adyacencia.añadir(instr)
+            rachas.setdefault(qubit, []).append(len(adyacencia.salida) - 1)
+            continue
+
+        # Cualquier otra instrucción sobre el qubit corta su racha
+        adyacencia.añadir(instr)
+        indice = len(adyacencia.salida) - 1
+        for qubit in list(rachas):
+            if adyacencia.pilas[qubit][-1] == indice:
+                cerrar(qubit)
+
+    for qubit in list(rachas):
+        cerrar(qubit)
+    return _reconstruir(program, adyacencia.salida, nuevas.values())
+
+
+PASES_POR_DEFECTO = (eliminar_identidades, cancelar_inversos, reconocer_swaps, fusionar_1q)
+# Sin fusión: el resultado sigue siendo Clifford si la entrada lo era
+PASES_CLIFFORD = (eliminar_identidades, cancelar_inversos, reconocer_swaps)
+
+
+def optimizar_programa(program, pases=PASES_POR_DEFECTO):
+    """Aplica los pases en orden; devuelve (programa, informe con puertas y profundidad por pase)"""
+    informe = []
+    for pase in pases:
+        puertas, capas = contar_puertas(program), profundidad(program)
+        program = pase(program)
+        informe.append({
+            'pase': pase.__name__,
+            'puertas_antes': puertas,
+            'puertas_despues': contar_puertas(program),
+            'profundidad_antes': capas,
+            'profundidad_despues': profundidad(program)
+        })
+    return program, informe
+
+
+def imprimir_informe(informe):
+    for fila in informe:
+        print(f"  {fila['pase']:<22} puertas {fila['puertas_antes']:>4} -> {fila['puertas_despues']:<4} "
+              f"profundidad {fila['profundidad_antes']:>4} -> {fila['profundidad_despues']}")
@@ -0,0 +1,148 @@
+"""
+Simulación incremental para inspeccionar el estado paso a paso.
+
+WavefunctionSimulator().wavefunction(prog) simula todo el programa desde
+|0⟩ en cada llamada: mirar k estados intermedios cuesta O(k²) puertas.
+SimuladorIncremental guarda el vector de estado y solo aplica las
+instrucciones nuevas, con instantáneas para volver atrás.
+"""
+
+import weakref
+
+import numpy as np
+from pyquil import Program
+from pyquil.quilbase import Declare, Gate, Halt, Pragma
+
+from .simulador_local import aplicar_matriz, matriz_puerta
+
+
+class SimuladorIncremental:
+    """
+    Estado de un programa que solo crece (prog.inst(...)).
+
+    Cada qubit nuevo se añade como un eje más del tensor, en |0⟩. Las
+    amplitudes se devuelven con el orden de estado_final: qubits usados,
+    ordenados, con el qubit i como bit i del índice.
+    """
+
+    def __init__(self, program=None, memoria=None):
+        self.memoria = memoria or {}
+        self.estado = np.ones((), dtype=np.complex128)
+        self.ejes = {}
+        self.definiciones = {}
+        self.instrucciones = []
+        self._instantaneas = []
+
+        if program is not None:
+            self.inst(program)
+
+    @property
+    def num_qubits(self):
+        return len(self.ejes)
+
+    def _añadir_qubit(self, qubit):
+        # El qubit nuevo ocupa el eje 0 en |0⟩: el resto se desplaza una posición
+        self.estado = np.stack([self.estado, np.zeros_like(self.estado)])
+        self.ejes = {q: eje + 1 for q, eje in self.ejes.items()}
+        self.ejes[qubit] = 0
+
+    def _aplicar(self, instr):
+        if isinstance(instr, Declare):
+            return
+        if isinstance(instr, Gate):
+            for q in instr.qubits:
+                if q.index not in self.ejes:
+                    self._añadir_qubit(q.index)
+            matriz = matriz_puerta(instr, self.definiciones, self.memoria)
+            self.estado = aplicar_matriz(self.estado, matriz, [self.ejes[q.index] for q in instr.qubits])
+        elif not isinstance(instr, (Pragma, Halt)):
+            raise ValueError(f"Instrucción no soportada en la simulación paso a paso: {instr}")
+        self.instrucciones.append(instr)
+
+    def inst(self, *instrucciones):
+        """Aplica instrucciones (puertas, listas o programas) sobre el estado actual"""
+        programa = Program(*instrucciones)
+        for definicion in programa.defined_gates:
+            self.definiciones[definicion.name] = definicion
+        for instr in programa.instructions:
+            self._aplicar(instr)
+        return self
+
+    def sincronizar(self, program):
+        """Aplica solo las instrucciones de program posteriores a las ya simuladas"""
+        for definicion in program.defined_gates:
+            self.definiciones.setdefault(definicion.name, definicion)
+
+        # Las declaraciones se ignoran: pyQuil las pone siempre al principio
+        instrucciones = _cuerpo(program)
+        if len(instrucciones) < len(self.instrucciones):
+            raise ValueError("El programa es más corto que el estado simulado: usar volver() o uno nuevo")
+        for instr in instrucciones[len(self.instrucciones):]:
+            self._aplicar(instr)
+        return self
+
+    def amplitudes(self):
+        orden = [self.ejes[q] for q in sorted(self.ejes, reverse=True)]
+        return np.transpose(self.estado, orden).reshape(-1)
+
+    def probabilidades(self):
+        return np.abs(self.amplitudes()) ** 2
+
+    def wavefunction(self):
+        """
+        Mismo objeto que devuelve WavefunctionSimulator, para imprimirlo igual:
+        como el QVM, con los qubits 0..máximo usado (los no usados en |0⟩).
+        """
+        # Import diferido: pyquil.wavefunction avisa de su obsolescencia al importarse
+        from pyquil.wavefunction import Wavefunction
+        qubits = sorted(self.ejes)
+        if not qubits:
+            return Wavefunction(self.amplitudes())
+
+        # El bit i del índice compacto es el qubit qubits[i]; en el completo, el bit qubits[i]
+        compactos = np.arange(2 ** len(qubits))
+        indices = np.zeros_like(compactos)
+        for i, q in enumerate(qubits):
+            indices |= ((compactos >> i) & 1) << q
+        completas = np.zeros(2 ** (qubits[-1] + 1), dtype=np.complex128)
+        completas[indices] = self.amplitudes()
+        return Wavefunction(completas)
+
+    def instantanea(self):
+        """Guarda el estado actual y devuelve su identificador para volver()"""
+        self._instantaneas.append((self.estado.copy(), dict(self.ejes), dict(self.definiciones),
+                                   len(self.instrucciones)))
+        return len(self._instantaneas) - 1
+
+    def volver(self, instantanea):
+        """Restaura una instantánea sin volver a simular; descarta las posteriores"""
+        estado, ejes, definiciones, num_instrucciones = self._instantaneas[instantanea]
+        self.estado = estado.copy()
+        self.ejes = dict(ejes)
+        self.definiciones = dict(definiciones)
+        del self.instrucciones[num_instrucciones:]
+        del self._instantaneas[instantanea + 1:]
+        return self
+
+
+def _cuerpo(program):
+    return [i for i in program.instructions if not isinstance(i, Declare)]
+
+
+# Por identidad: el hash de Program depende de su contenido y cambia con inst()
+_simuladores = {}
+
+
+def wavefunction_incremental(program):
+    """
+    Sustituto de WavefunctionSimulator().wavefunction(program) para
+    programas que se amplían con inst(): reutiliza el estado de la llamada
+    anterior con el mismo programa.
+    """
+    clave = id(program)
+    referencia, simulador = _simuladores.get(clave, (None, None))
+    if referencia is None or referencia() is not program or len(_cuerpo(program)) < len(simulador.instrucciones):
+        simulador = SimuladorIncremental()
+        referencia = weakref.ref(program, lambda _: _simuladores.pop(clave, None))
+        _simuladores[clave] = (referencia, simulador)
+    return simulador.sincronizar(program).wavefunction()
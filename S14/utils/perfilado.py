@@ -0,0 +1,103 @@
+import sys
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+
+import pyquil
+from pyquil.api import QuantumComputer
+
+
+_DIRECTORIOS_INTERNOS = (
+    str(Path(__file__).parent),
+    str(Path(pyquil.__file__).parent),
+)
+
+_perfiles_activos = []
+_lock = threading.Lock()
+_run_original = QuantumComputer.run
+
+
+def _sitio_llamada():
+    """Primer marco fuera de utils/ y de pyquil: la línea que lanzó la ejecución"""
+    frame = sys._getframe(1)
+    while frame is not None:
+        ruta = frame.f_code.co_filename
+        if not ruta.startswith(_DIRECTORIOS_INTERNOS) and "contextlib" not in ruta:
+            return f"{ruta}:{frame.f_lineno}"
+        frame = frame.f_back
+    return "<desconocido>"
+
+
+class PerfilDisparos:
+    """Cuenta las ejecuciones por línea de código y detecta bucles de un shot por llamada"""
+
+    def __init__(self, umbral=10):
+        self.umbral = umbral
+        self.llamadas = defaultdict(int)
+        self.shots = defaultdict(int)
+        self.max_shots = defaultdict(int)
+
+    def registrar(self, sitio, num_shots):
+        self.llamadas[sitio] += 1
+        self.shots[sitio] += num_shots
+        self.max_shots[sitio] = max(self.max_shots[sitio], num_shots)
+
+    def bucles(self):
+        return [
+            {
+                'sitio': sitio,
+                'llamadas': llamadas,
+                'shots_totales': self.shots[sitio]
+            }
+            for sitio, llamadas in sorted(self.llamadas.items(), key=lambda x: -x[1])
+            if llamadas >= self.umbral and self.max_shots[sitio] <= 1
+        ]
+
+    def imprimir_informe(self):
+        print(f"\nEjecuciones registradas: {sum(self.llamadas.values())}")
+        bucles = self.bucles()
+        if not bucles:
+            print("No se han detectado bucles de un shot por llamada\n")
+            return
+
+        for bucle in bucles:
+            print(f"  {bucle['sitio']}: {bucle['llamadas']} llamadas de 1 shot")
+        print("→ Usar wrap_in_numshots_loop(N) o ejecutar_programa(..., modo=\"distribucion\")\n")
+
+
+def registrar_ejecucion(num_shots):
+    if not _perfiles_activos:
+        return
+
+    sitio = _sitio_llamada()
+    with _lock:
+        for perfil in _perfiles_activos:
+            perfil.registrar(sitio, num_shots)
+
+
+def _run_registrado(qc, executable, *args, **kwargs):
+    registrar_ejecucion(getattr(executable, "num_shots", 1))
+    return _run_original(qc, executable, *args, **kwargs)
+
+
+@contextmanager
+def perfil_disparos(umbral=10):
+    """
+    Activa el modo perfil: registra cada ejecución (también las llamadas
+    directas a QuantumComputer.run de notebooks y scripts).
+    """
+    perfil = PerfilDisparos(umbral)
+
+    with _lock:
+        if not _perfiles_activos:
+            QuantumComputer.run = _run_registrado
+        _perfiles_activos.append(perfil)
+
+    try:
+        yield perfil
+    finally:
+        with _lock:
+            _perfiles_activos.remove(perfil)
+            if not _perfiles_activos:
+                QuantumComputer.run = _run_original
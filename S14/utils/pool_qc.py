@@ -0,0 +1,86 @@
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from pyquil import get_qc
+
+
+class PoolQC:
+    """
+    Pool de QuantumComputer reutilizables, indexado por dispositivo y ruido.
+
+    get_qc reconstruye topología, ISA y clientes cada vez; el pool guarda
+    los objetos ya creados y los presta a un solo hilo cada vez.
+    """
+
+    def __init__(self, tiempo_inactividad=300.0, max_por_clave=8, fabrica=get_qc):
+        self.tiempo_inactividad = tiempo_inactividad
+        self.max_por_clave = max_por_clave
+        self._fabrica = fabrica
+        self._libres = defaultdict(list)
+        self._lock = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+
+    def adquirir(self, nombre, noisy=False):
+        clave = (nombre, bool(noisy))
+
+        with self._lock:
+            self._desalojar_inactivos()
+            libres = self._libres[clave]
+            if libres:
+                qc, _ = libres.pop()
+                self.aciertos += 1
+                return qc
+            self.fallos += 1
+
+        # Fuera del lock: crear un QuantumComputer es lento
+        return self._fabrica(nombre, noisy=bool(noisy))
+
+    def liberar(self, qc, nombre, noisy=False):
+        clave = (nombre, bool(noisy))
+
+        with self._lock:
+            libres = self._libres[clave]
+            if len(libres) < self.max_por_clave:
+                libres.append((qc, time.monotonic()))
+
+    @contextmanager
+    def usar(self, nombre, noisy=False):
+        qc = self.adquirir(nombre, noisy)
+        try:
+            yield qc
+        finally:
+            self.liberar(qc, nombre, noisy)
+
+    def _desalojar_inactivos(self):
+        limite = time.monotonic() - self.tiempo_inactividad
+
+        for clave in list(self._libres):
+            libres = self._libres[clave]
+            vigentes = [(qc, uso) for qc, uso in libres if uso >= limite]
+            self.desalojos += len(libres) - len(vigentes)
+            if vigentes:
+                self._libres[clave] = vigentes
+            else:
+                del self._libres[clave]
+
+    def vaciar(self):
+        with self._lock:
+            self._libres.clear()
+
+    def estadisticas(self):
+        with self._lock:
+            total = self.aciertos + self.fallos
+            return {
+                'aciertos': self.aciertos,
+                'fallos': self.fallos,
+                'desalojos': self.desalojos,
+                'tasa_aciertos': (self.aciertos / total) * 100 if total else 0.0,
+                'libres': {clave: len(libres) for clave, libres in self._libres.items()}
+            }
+
+
+pool_global = PoolQC()
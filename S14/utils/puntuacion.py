@@ -0,0 +1,109 @@
+"""
+Puntuación de partidas de monedas (S08) sobre el registro completo.
+
+Cada shot se decodifica a un entero (la columna j es el bit j, el jugador
+j+1) y se cuenta con un único bincount. El resultado de cada partida sale
+de una tabla de 2^n entradas indexada por ese entero, y las caras y cruces
+por jugador se obtienen del mismo histograma: no se vuelve a recorrer el
+registro.
+
+Cara = 0, cruz = 1.
+"""
+
+import numpy as np
+from scipy.stats import binomtest
+
+from .decodificacion import bits_a_enteros
+
+
+EMPATE = 0
+
+
+def patrones(num_jugadores):
+    """Matriz (2^n, n) con los bits de cada entero: fila i, columna j = bit j de i"""
+    indices = np.arange(2 ** num_jugadores)
+    return (indices[:, None] >> np.arange(num_jugadores)) & 1
+
+
+def tabla_desde_regla(regla, num_jugadores):
+    """
+    Evalúa regla(bits) -> código sobre todas las combinaciones de monedas.
+
+    bits es la matriz de patrones(num_jugadores); la regla debe devolver un
+    entero por fila (EMPATE o el número del jugador que gana).
+    """
+    tabla = np.asarray(regla(patrones(num_jugadores)), dtype=np.int64)
+    if tabla.shape != (2 ** num_jugadores,):
+        raise ValueError("La regla debe devolver un código por combinación")
+    return tabla
+
+
+def _regla_dos_jugadores(bits):
+    # Gana quien saca cara mientras el otro saca cruz
+    j1, j2 = bits[:, 0], bits[:, 1]
+    return np.where((j1 == 0) & (j2 == 1), 1, np.where((j1 == 1) & (j2 == 0), 2, EMPATE))
+
+
+def _regla_tres_jugadores(bits):
+    # El jugador 1 gana si los otros dos coinciden y él saca lo contrario
+    j1, j2, j3 = bits[:, 0], bits[:, 1], bits[:, 2]
+    return np.where((j2 == j3) & (j1 != j2), 1, EMPATE)
+
+
+TABLA_DOS_JUGADORES = tabla_desde_regla(_regla_dos_jugadores, 2)
+TABLA_TRES_JUGADORES = tabla_desde_regla(_regla_tres_jugadores, 3)
+
+
+def analizar_partidas(resultado, tabla):
+    """
+    Estadísticas de todas las tiradas a partir del histograma de shots.
+
+    Devuelve tiradas, victorias por código de la tabla (índice 0 = empates)
+    y caras/cruces por jugador.
+    """
+    resultado = np.atleast_2d(np.asarray(resultado))
+    num_jugadores = resultado.shape[1]
+    if len(tabla) != 2 ** num_jugadores:
+        raise ValueError("La tabla no corresponde al número de jugadores del registro")
+
+    conteos = np.bincount(bits_a_enteros(resultado, orden="lsb"), minlength=len(tabla))
+    cruces = conteos @ patrones(num_jugadores)
+
+    return {
+        'tiradas': len(resultado),
+        'victorias': np.bincount(tabla, weights=conteos, minlength=num_jugadores + 1).astype(np.int64),
+        'caras': len(resultado) - cruces,
+        'cruces': cruces
+    }
+
+
+def prueba_binomial(caras, tiradas, p=0.5, alternativa="two-sided"):
+    """p-valor exacto de obtener `caras` en `tiradas` con una moneda de probabilidad p"""
+    return binomtest(int(caras), int(tiradas), p, alternative=alternativa).pvalue
+
+
+def detectar_trampas(estadisticas, alfa=0.01, p=0.5):
+    """
+    Prueba binomial de dos colas por jugador sobre las caras.
+
+    Un jugador que siempre saca cara en 50 tiradas tiene p-valor 2·0.5^50:
+    se marca como tramposo. Con pocas tiradas el test no tiene potencia y
+    nadie queda marcado.
+    """
+    tiradas = estadisticas['tiradas']
+    jugadores = []
+    for caras, cruces in zip(estadisticas['caras'], estadisticas['cruces']):
+        p_valor = prueba_binomial(caras, tiradas, p) if tiradas else 1.0
+        siempre = None
+        if tiradas and cruces == 0:
+            siempre = "cara"
+        elif tiradas and caras == 0:
+            siempre = "cruz"
+        jugadores.append({
+            'caras': int(caras),
+            'cruces': int(cruces),
+            'siempre': siempre,
+            'p_valor': float(p_valor),
+            'tramposo': bool(p_valor < alfa)
+        })
+    return jugadores
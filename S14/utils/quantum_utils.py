@@ -1,7 +1,19 @@
-from pyquil import Program, get_qc
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from pyquil import Program
 from pyquil.gates import H, MEASURE
 from pyquil.quilbase import Declare
 
+from .cache_compilacion import compilar
+from .decodificacion import bits_a_enteros
+from .dinamico import ejecutar_en_proceso
+from .estabilizador import ejecutar_estabilizador, es_clifford
+from .flujo import ejecutar_en_flujo
+from .muestreo import ejecutar_distribucion
+from .optimizacion import PASES_CLIFFORD, PASES_POR_DEFECTO, optimizar_programa
+from .pool_qc import pool_global
+
 
 def crear_programa_base(num_qubits, aplicar_hadamard=True):
     prog = Program(Declare("ro", "BIT", num_qubits))
@@ -19,15 +31,118 @@ def medir_qubits(program, qubits):
     return program
 
 
-def ejecutar_programa(program, num_shots=1, qvm_name='9q-square-qvm'):
-    qvm = get_qc(qvm_name)
+def combinaciones_memoria(parametros):
+    """
+    {"theta": [v0, v1, ...]} -> [{"theta": [v0]}, {"theta": [v1]}, ...]
+
+    Cada valor puede ser un escalar o un vector para regiones de varias
+    posiciones; todos los parámetros deben tener el mismo número de valores.
+    """
+    columnas = {nombre: np.asarray(valores) for nombre, valores in parametros.items()}
+    longitudes = {len(valores) for valores in columnas.values()}
+    if len(longitudes) != 1:
+        raise ValueError("Todos los parámetros necesitan el mismo número de valores")
+
+    return [
+        {nombre: np.atleast_1d(valores[i]).tolist() for nombre, valores in columnas.items()}
+        for i in range(longitudes.pop())
+    ]
+
+
+def _mapear(funcion, elementos, max_workers):
+    if max_workers and max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as ejecutor:
+            return list(ejecutor.map(funcion, elementos))
+    return [funcion(e) for e in elementos]
+
+
+def _ejecutar_barrido(program, memorias, qvm_name, noisy, backend, max_workers):
+    if backend == "local":
+        if noisy:
+            raise ValueError("El backend local no simula ruido: usa backend=\"qvm\" con noisy=True")
+        return _mapear(lambda memoria: ejecutar_en_proceso(program, memoria=memoria).get("ro"),
+                       memorias, max_workers)
+    if backend != "qvm":
+        raise ValueError(f"Backend desconocido: {backend}")
+
+    # Un único compilado; cada ejecución solo cambia la memoria clásica
+    with pool_global.usar(qvm_name, noisy) as qvm:
+        ejecutable = compilar(qvm, program)
+
+    # Cada hilo toma su propio QuantumComputer del pool: no se comparten entre hilos
+    def ejecutar(memoria):
+        with pool_global.usar(qvm_name, noisy) as qvm:
+            return qvm.run(ejecutable, memory_map=memoria).get_register_map().get("ro")
+
+    return _mapear(ejecutar, memorias, max_workers)
+
+
+def ejecutar_programa(program, num_shots=1, qvm_name='9q-square-qvm', noisy=False, backend="auto",
+                      modo="shots", parametros=None, max_workers=None, optimizar=False):
+    """
+    Ejecuta el programa y devuelve el registro "ro".
+
+    Con parametros (regiones DECLARE ... REAL -> valores) el programa se
+    compila una sola vez y se ejecuta con cada combinación, en paralelo si
+    max_workers > 1; devuelve entonces una lista con un "ro" por combinación.
+
+    Con modo="flujo" devuelve un generador de bloques de "ro" (ver
+    flujo.ejecutar_en_flujo) para agregarlos sin tener todos los shots en memoria.
+
+    backend="auto" (por defecto) usa el simulador de estabilizadores si el
+    programa es Clifford (en modo "shots" o "flujo", sin parámetros ni ruido)
+    y el qvm si no. backend="estabilizador" solo admite esos mismos casos.
+
+    Con optimizar=True se aplican antes los pases de optimizacion.py; con el
+    simulador de estabilizadores, sin la fusión de puertas (crea DEFGATEs).
+    No se admite con noisy=True: en el QVM ruidoso las puertas I y los pares
+    de inversas llevan tiempo y ruido a propósito (S12), y quitarlas o
+    fusionarlas cambiaría el resultado.
+    """
+    if backend == "auto":
+        clifford = modo in ("shots", "flujo") and parametros is None and not noisy and es_clifford(program)
+        backend = "estabilizador" if clifford else "qvm"
+    elif backend == "estabilizador" and (modo not in ("shots", "flujo") or parametros is not None or noisy):
+        raise ValueError("El simulador de estabilizadores solo admite modo=\"shots\" o \"flujo\", "
+                         "sin parámetros ni ruido")
+
+    if optimizar and noisy:
+        raise ValueError("optimizar no es compatible con noisy=True: los pases quitan puertas que llevan ruido")
+    if optimizar:
+        pases = PASES_CLIFFORD if backend == "estabilizador" else PASES_POR_DEFECTO
+        program, _ = optimizar_programa(program, pases)
+
+    if modo == "flujo" and parametros is None:
+        return ejecutar_en_flujo(program, num_shots, qvm_name=qvm_name, noisy=noisy, backend=backend)
+
     program_wrapped = program.wrap_in_numshots_loop(num_shots)
-    result = qvm.run(qvm.compile(program_wrapped))
+
+    if parametros is not None:
+        if modo != "shots":
+            raise ValueError("Los barridos de parámetros solo admiten modo=\"shots\"")
+        return _ejecutar_barrido(program_wrapped, combinaciones_memoria(parametros), qvm_name, noisy,
+                                 backend, max_workers)
+
+    if modo == "distribucion":
+        return ejecutar_distribucion(program_wrapped, num_shots, backend, qvm_name=qvm_name,
+                                     noisy=noisy).get("ro")
+    if modo != "shots":
+        raise ValueError(f"Modo desconocido: {modo}")
+
+    if backend == "local":
+        if noisy:
+            raise ValueError("El backend local no simula ruido: usa backend=\"qvm\" con noisy=True")
+        return ejecutar_en_proceso(program_wrapped).get("ro")
+    if backend == "estabilizador":
+        return ejecutar_estabilizador(program_wrapped).get("ro")
+    if backend != "qvm":
+        raise ValueError(f"Backend desconocido: {backend}")
+
+    with pool_global.usar(qvm_name, noisy) as qvm:
+        result = qvm.run(compilar(qvm, program_wrapped))
     return result.get_register_map().get("ro")
 
 
 def interpretar_resultado_binario(bits):
-    resultado = 0
-    for i, bit in enumerate(bits):
-        resultado += bit * (2 ** (len(bits) - 1 - i))
-    return resultado
+    # Un shot (lista de bits) o el registro completo (shots, n); el primer bit es el más significativo
+    return bits_a_enteros(bits, orden="msb")
@@ -0,0 +1,109 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from pyquil.quilatom import substitute_array
+
+
+def matriz_permutacion(permutacion):
+    dim = len(permutacion)
+    matriz = np.zeros((dim, dim), dtype=np.complex128)
+    matriz[permutacion, np.arange(dim)] = 1
+    return matriz
+
+
+def matriz_definicion(definicion, parametros=()):
+    """Evalúa un DefGate (matriz, permutación o con parámetros) a complex128 contiguo"""
+    especificacion = definicion.specification
+    if especificacion.is_permutation():
+        return matriz_permutacion(especificacion.to_permutation())
+
+    matriz = definicion.matrix
+    if definicion.parameters:
+        matriz = substitute_array(matriz, dict(zip(definicion.parameters, parametros)))
+    return np.ascontiguousarray(matriz, dtype=np.complex128)
+
+
+def es_unitaria(matriz, tolerancia=1e-8):
+    return np.allclose(matriz @ matriz.conj().T, np.eye(len(matriz)), atol=tolerancia)
+
+
+class RegistroPuertas:
+    """
+    Matrices de DefGate evaluadas una vez por tupla de parámetros.
+
+    Evaluar las expresiones simbólicas (quil_cos, quil_sin...) de un DefGate
+    cuesta del orden de 100 µs; la cache LRU las guarda como arrays complex128
+    de solo lectura. La unitariedad se comprueba una vez al registrar la
+    definición (en puertas con parámetros, en unos cuantos valores de prueba).
+    """
+
+    def __init__(self, max_entradas=512, semilla=0):
+        self.max_entradas = max_entradas
+        self._definiciones = {}
+        self._matrices = OrderedDict()
+        self._rng = np.random.default_rng(semilla)
+        self._lock = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+
+    def registrar(self, definicion):
+        """Valida la definición y devuelve su clave (el texto Quil del DEFGATE)"""
+        clave = definicion.out()
+        if clave in self._definiciones:
+            return clave
+
+        valores_prueba = [()]
+        if definicion.parameters:
+            with self._lock:
+                valores_prueba = self._rng.uniform(-2 * np.pi, 2 * np.pi, (3, len(definicion.parameters)))
+
+        for parametros in valores_prueba:
+            if not es_unitaria(matriz_definicion(definicion, parametros)):
+                raise ValueError(f"La puerta {definicion.name} no es unitaria")
+
+        with self._lock:
+            self._definiciones[clave] = definicion
+        return clave
+
+    def matriz(self, definicion, parametros=()):
+        clave = (self.registrar(definicion), tuple(parametros))
+
+        with self._lock:
+            matriz = self._matrices.get(clave)
+            if matriz is not None:
+                self._matrices.move_to_end(clave)
+                self.aciertos += 1
+                return matriz
+            self.fallos += 1
+
+        matriz = matriz_definicion(definicion, parametros)
+        matriz.flags.writeable = False
+
+        with self._lock:
+            self._matrices[clave] = matriz
+            while len(self._matrices) > self.max_entradas:
+                self._matrices.popitem(last=False)
+                self.desalojos += 1
+        return matriz
+
+    def vaciar(self):
+        with self._lock:
+            self._definiciones.clear()
+            self._matrices.clear()
+
+    def estadisticas(self):
+        with self._lock:
+            total = self.aciertos + self.fallos
+            return {
+                'definiciones': len(self._definiciones),
+                'matrices': len(self._matrices),
+                'aciertos': self.aciertos,
+                'fallos': self.fallos,
+                'desalojos': self.desalojos,
+                'tasa_aciertos': (self.aciertos / total) * 100 if total else 0.0
+            }
+
+
+registro_global = RegistroPuertas()
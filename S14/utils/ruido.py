@@ -0,0 +1,113 @@
+"""
+Ruido aplicado a posteriori sobre registros de medida (shots, qubits).
+
+Todas las funciones trabajan sobre el array completo de una vez y aceptan
+un np.random.Generator para que los resultados sean reproducibles.
+"""
+
+import numpy as np
+
+
+FILAS_POR_BLOQUE = 1 << 18
+
+
+def _generador(rng):
+    if isinstance(rng, np.random.Generator):
+        return rng
+    return np.random.default_rng(rng)
+
+
+def _por_qubit(valor, num_qubits):
+    return np.broadcast_to(np.asarray(valor, dtype=np.float32), (num_qubits,))
+
+
+def matriz_confusion(p00, p11):
+    """Matriz de lectura [[p(0|0), p(0|1)], [p(1|0), p(1|1)]] de un qubit"""
+    return np.array([[p00, 1 - p11], [1 - p00, p11]])
+
+
+def aplicar_ruido_lectura(resultados_bits, p00=0.95, p11=0.95, rng=None, out=None):
+    """
+    Invierte cada bit con probabilidad 1-p00 (si vale 0) o 1-p11 (si vale 1).
+
+    p00 y p11 pueden ser escalares o un valor por qubit. Se procesa por
+    bloques de filas para no crear temporales del tamaño de todo el array.
+    """
+    bits = np.asarray(resultados_bits)
+    rng = _generador(rng)
+    num_qubits = bits.shape[1]
+
+    error_0 = 1 - _por_qubit(p00, num_qubits)
+    error_1 = 1 - _por_qubit(p11, num_qubits)
+    diferencia = error_1 - error_0
+
+    if out is None:
+        out = np.empty_like(bits)
+
+    for inicio in range(0, len(bits), FILAS_POR_BLOQUE):
+        bloque = bits[inicio:inicio + FILAS_POR_BLOQUE]
+        # Probabilidad de error según el valor del bit: 1-p00 si es 0, 1-p11 si es 1
+        umbral = error_0 + bloque * diferencia
+        errores = rng.random(bloque.shape, dtype=np.float32) < umbral
+        np.not_equal(bloque, errores, out=out[inicio:inicio + FILAS_POR_BLOQUE], casting="unsafe")
+
+    return out
+
+
+def tiempo_expuesto(gate_time, num_qubits):
+    """
+    Tiempo total de cada qubit: escalar, un valor por qubit o una
+    planificación (num_puertas, qubits) de duraciones que se suman.
+    """
+    tiempos = np.asarray(gate_time, dtype=np.float64)
+    if tiempos.ndim == 2:
+        tiempos = tiempos.sum(axis=0)
+    return np.broadcast_to(tiempos, (num_qubits,))
+
+
+def probabilidad_relajacion(T1, gate_time, num_qubits, T2=None):
+    T1 = np.broadcast_to(np.asarray(T1, dtype=np.float64), (num_qubits,))
+    if T2 is not None:
+        T2 = np.broadcast_to(np.asarray(T2, dtype=np.float64), (num_qubits,))
+        if np.any(T2 > 2 * T1):
+            raise ValueError("T2 no puede ser mayor que 2*T1")
+    return 1 - np.exp(-tiempo_expuesto(gate_time, num_qubits) / T1)
+
+
+def aplicar_ruido_t1(resultados_bits, T1, gate_time=200e-9, T2=None, rng=None, out=None):
+    """
+    Relajación T1: cada bit a 1 decae a 0 con probabilidad 1 - exp(-t/T1).
+
+    T1, T2 y gate_time admiten un valor por qubit. T2 solo se valida: el
+    desfase no cambia bits ya medidos en la base computacional (para
+    simularlo hace falta la matriz densidad).
+    """
+    bits = np.asarray(resultados_bits)
+    rng = _generador(rng)
+    p_relax = probabilidad_relajacion(T1, gate_time, bits.shape[1], T2).astype(np.float32)
+
+    if out is None:
+        out = np.empty_like(bits)
+
+    for inicio in range(0, len(bits), FILAS_POR_BLOQUE):
+        bloque = bits[inicio:inicio + FILAS_POR_BLOQUE]
+        sobrevive = rng.random(bloque.shape, dtype=np.float32) >= p_relax
+        np.multiply(bloque, sobrevive, out=out[inicio:inicio + FILAS_POR_BLOQUE], casting="unsafe")
+
+    return out
+
+
+def aplicar_en_flujo(bloques, ruido, *args, rng=None, **kwargs):
+    """
+    Aplica una función de ruido a un generador de bloques (shots, qubits).
+
+    Solo hay un bloque en memoria a la vez, así que barridos de 10^8 shots
+    ocupan memoria constante. Todos los bloques comparten el mismo Generator.
+    """
+    rng = _generador(rng)
+    for bloque in bloques:
+        yield ruido(bloque, *args, rng=rng, **kwargs)
+
+
+def aplicar_ruido_t1_en_flujo(bloques, T1, gate_time=200e-9, T2=None, rng=None):
+    return aplicar_en_flujo(bloques, aplicar_ruido_t1, T1, gate_time, T2, rng=rng)
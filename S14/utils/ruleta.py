@@ -0,0 +1,122 @@
+"""
+Simulación vectorizada de la ruleta francesa del S05.
+
+Cada apuesta se codifica como un entero:
+- 0..36: número concreto
+- 37/38: par/impar
+- 39/40: manque (1-18)/passe (19-36)
+- 41/42: rojo/negro
+"""
+
+import numpy as np
+
+
+NUM_CASILLAS = 37
+NUM_APUESTAS = 43
+
+_APUESTAS_SENCILLAS = [
+    ("paridad", "par"), ("paridad", "impar"),
+    ("rango", "manque"), ("rango", "passe"),
+    ("color", "rojo"), ("color", "negro")
+]
+
+
+def colores_por_defecto():
+    """Mismo reparto que numeros_colores del S05: 0 verde, impares rojos, pares negros"""
+    return {i: "verde" if i == 0 else ("negro" if i % 2 == 0 else "rojo") for i in range(NUM_CASILLAS)}
+
+
+def tabla_ganadoras(numeros_colores=None):
+    """Matriz booleana (apuesta, número): True si la apuesta gana con ese número"""
+    numeros_colores = numeros_colores or colores_por_defecto()
+    numeros = np.arange(NUM_CASILLAS)
+    colores = np.array([numeros_colores[n] for n in numeros])
+    no_cero = numeros != 0
+
+    tabla = np.zeros((NUM_APUESTAS, NUM_CASILLAS), dtype=bool)
+    tabla[numeros, numeros] = True
+    tabla[37] = no_cero & (numeros % 2 == 0)
+    tabla[38] = no_cero & (numeros % 2 == 1)
+    tabla[39] = no_cero & (numeros <= 18)
+    tabla[40] = numeros >= 19
+    tabla[41] = no_cero & (colores == "rojo")
+    tabla[42] = no_cero & (colores == "negro")
+    return tabla
+
+
+def describir_apuesta(codigo):
+    """Apuesta en el formato {"tipo", "valor"} de Jugador.realizar_apuesta"""
+    codigo = int(codigo)
+    if codigo < NUM_CASILLAS:
+        return {"tipo": "numero", "valor": codigo}
+    tipo, valor = _APUESTAS_SENCILLAS[codigo - NUM_CASILLAS]
+    return {"tipo": tipo, "valor": valor}
+
+
+def _sorteo(entropia, rng, n, forma):
+    if entropia is None:
+        return rng.integers(0, n, size=forma)
+    return entropia.enteros(n, int(np.prod(forma))).reshape(forma)
+
+
+def sortear_apuestas(forma, entropia=None, rng=None):
+    """
+    Códigos de apuesta con el mismo reparto que Jugador: tipo uniforme
+    entre los 4 y después número (1/37) o una de las dos opciones.
+    """
+    tipos = _sorteo(entropia, rng, 4, forma)
+    numeros = _sorteo(entropia, rng, NUM_CASILLAS, forma)
+    opciones = _sorteo(entropia, rng, 2, forma)
+    return np.where(tipos == 0, numeros, NUM_CASILLAS + 2 * (tipos - 1) + opciones)
+
+
+def simular_partidas(num_partidas, num_rondas, num_jugadores=2, monedas_jugador=10,
+                     monedas_croupier=20, entropia=None, semilla=None, numeros_colores=None):
+    """
+    Juega num_partidas partidas de num_rondas rondas con todos los sorteos
+    hechos de antemano.
+
+    Las apuestas se liquidan con una consulta a tabla_ganadoras y los saldos
+    son sumas acumuladas; cada partida termina en la primera ronda en la que
+    algún jugador se queda sin monedas, como JuegoRuleta.jugar. Con entropia
+    (un PoolEntropia) los sorteos son cuánticos; si no, usa numpy.
+    """
+    rng = np.random.default_rng(semilla)
+    forma = (num_partidas, num_rondas)
+
+    numeros = _sorteo(entropia, rng, NUM_CASILLAS, forma)
+    apuestas = sortear_apuestas(forma + (num_jugadores,), entropia, rng)
+    gana = tabla_ganadoras(numeros_colores)[apuestas, numeros[..., None]]
+
+    # Saldo de cada jugador al final de cada ronda
+    saldos = monedas_jugador + np.cumsum(np.where(gana, 1, -1), axis=1, dtype=np.int32)
+
+    arruinada = (saldos <= 0).any(axis=2)
+    ultima = np.where(arruinada.any(axis=1), arruinada.argmax(axis=1), num_rondas - 1)
+    partidas = np.arange(num_partidas)
+
+    monedas_jugadores = saldos[partidas, ultima]
+    monedas_finales_croupier = monedas_croupier - (monedas_jugadores - monedas_jugador).sum(axis=1)
+
+    return {
+        'numeros': numeros,
+        'apuestas': apuestas,
+        'gana': gana,
+        'rondas_jugadas': ultima + 1,
+        'monedas_jugadores': monedas_jugadores,
+        'monedas_croupier': monedas_finales_croupier
+    }
+
+
+def resumir_partidas(resultado):
+    rondas = resultado['rondas_jugadas']
+    jugadas = np.arange(resultado['gana'].shape[1]) < rondas[:, None]
+    return {
+        'partidas': len(rondas),
+        'rondas_totales': int(rondas.sum()),
+        'rondas_medias': float(rondas.mean()),
+        'tasa_victorias': float(resultado['gana'][jugadas].mean()) * 100,
+        'monedas_medias_jugadores': resultado['monedas_jugadores'].mean(axis=0),
+        'monedas_media_croupier': float(resultado['monedas_croupier'].mean()),
+        'bancarrotas': int((resultado['monedas_jugadores'] <= 0).any(axis=1).sum())
+    }
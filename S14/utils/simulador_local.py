@@ -0,0 +1,310 @@
+"""
+Simulador de vector de estado en NumPy, sin depender de los contenedores qvm/quilc.
+
+Convención de pyQuil: el qubit i es el bit i (menos significativo primero)
+del índice de la amplitud. Internamente el estado es un tensor (2,)*n en el
+que el qubit local i ocupa el eje n-1-i.
+
+Cada puerta se clasifica una vez al traducir el programa (ver clasificar):
+los qubits de control solo seleccionan la vista del estado con esos ejes a
+1, y sobre ella la parte objetivo se aplica como permutación de índices,
+producto elemento a elemento si es diagonal, o contracción densa si no
+queda otro remedio.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+from pyquil.quilatom import Expression, MemoryReference, substitute
+from pyquil.quilbase import Declare, Gate, Halt, Measurement, Pragma
+from pyquil.simulation.matrices import QUANTUM_GATES
+
+from .perfilado import registrar_ejecucion
+from .registro_puertas import registro_global
+
+
+TIPOS_ENTEROS = ("BIT", "OCTET", "INTEGER")
+
+
+def _evaluar(parametro, memoria):
+    if isinstance(parametro, MemoryReference):
+        parametro = memoria[parametro.name][parametro.offset]
+    elif isinstance(parametro, Expression):
+        sustituciones = {
+            MemoryReference(nombre, i): valor
+            for nombre, valores in memoria.items()
+            for i, valor in enumerate(valores)
+        }
+        parametro = substitute(parametro, sustituciones)
+
+    valor = complex(parametro)
+    return valor.real if valor.imag == 0 else valor
+
+
+def aplicar_modificadores(matriz, modificadores):
+    # "CONTROLLED DAGGER X": el modificador más interno es el último
+    for modificador in reversed(modificadores):
+        if modificador == "DAGGER":
+            matriz = matriz.conj().T
+        elif modificador == "CONTROLLED":
+            dim = matriz.shape[0]
+            controlada = np.eye(2 * dim, dtype=np.complex128)
+            controlada[dim:, dim:] = matriz
+            matriz = controlada
+        else:
+            raise ValueError(f"Modificador no soportado en el simulador local: {modificador}")
+    return matriz
+
+
+def matriz_puerta(gate, definiciones, memoria=None):
+    parametros = [_evaluar(p, memoria or {}) for p in gate.params]
+
+    if gate.name in definiciones:
+        matriz = registro_global.matriz(definiciones[gate.name], parametros)
+    elif gate.name in QUANTUM_GATES:
+        matriz = QUANTUM_GATES[gate.name]
+        if parametros:
+            matriz = matriz(*parametros)
+        matriz = np.asarray(matriz, dtype=np.complex128)
+    else:
+        raise ValueError(f"Puerta no soportada en el simulador local: {gate.name}")
+
+    return aplicar_modificadores(matriz, gate.modifiers)
+
+
+def aplicar_matriz(estado, matriz, ejes):
+    k = len(ejes)
+    tensor = matriz.reshape((2,) * (2 * k))
+    estado = np.tensordot(tensor, estado, axes=(list(range(k, 2 * k)), ejes))
+    return np.moveaxis(estado, list(range(k)), ejes)
+
+
+@lru_cache(maxsize=1024)
+def _clasificar(datos, k):
+    matriz = np.frombuffer(datos, dtype=np.complex128).reshape(2 ** k, 2 ** k)
+    indices = np.arange(2 ** k)
+
+    # Qubit j (bit k-1-j del índice) es de control si la puerta no mezcla sus
+    # dos valores y es la identidad cuando vale 0
+    controles = []
+    for j in range(k):
+        bit = (indices >> (k - 1 - j)) & 1
+        mezcla = matriz[bit[:, None] != bit[None, :]]
+        bloque_cero = matriz[np.ix_(bit == 0, bit == 0)]
+        if np.allclose(mezcla, 0) and np.allclose(bloque_cero, np.eye(len(bloque_cero))):
+            controles.append(j)
+
+    activos = np.ones(2 ** k, dtype=bool)
+    for j in controles:
+        activos &= ((indices >> (k - 1 - j)) & 1) == 1
+    objetivos = tuple(j for j in range(k) if j not in controles)
+    sub = matriz[np.ix_(activos, activos)]
+
+    if np.allclose(sub, np.diag(np.diag(sub))):
+        diagonal = np.diag(sub).copy()
+        tipo = "identidad" if np.allclose(diagonal, 1) else "diagonal"
+        return tuple(controles), objetivos, tipo, diagonal, None
+
+    no_nulos = ~np.isclose(sub, 0)
+    if (no_nulos.sum(axis=0) == 1).all() and (no_nulos.sum(axis=1) == 1).all():
+        # Monomial: permutación (salida perm[i] <- entrada i) seguida de fases por salida
+        permutacion = no_nulos.argmax(axis=0)
+        fases = sub[permutacion, np.arange(len(sub))]
+        fases_salida = np.empty_like(fases)
+        fases_salida[permutacion] = fases
+        return tuple(controles), objetivos, "permutacion", fases_salida, np.argsort(permutacion)
+
+    return tuple(controles), objetivos, "densa", sub, None
+
+
+def clasificar(matriz, ejes):
+    """
+    Núcleo de una puerta: (ejes de control, ejes objetivo, tipo, datos, inversa).
+
+    tipo es "identidad", "diagonal" (datos = diagonal), "permutacion"
+    (inversa = índice de entrada de cada salida, datos = fases de salida) o
+    "densa" (datos = submatriz sobre los objetivos).
+    """
+    matriz = np.ascontiguousarray(matriz, dtype=np.complex128)
+    controles, objetivos, tipo, datos, inversa = _clasificar(matriz.tobytes(), len(ejes))
+    return [ejes[j] for j in controles], [ejes[j] for j in objetivos], tipo, datos, inversa
+
+
+def _factor(valores, ejes, ndim):
+    """valores (2^t, en el orden de ejes) con forma para multiplicar por broadcasting"""
+    orden = np.argsort(ejes)
+    factor = valores.reshape((2,) * len(ejes)).transpose(orden)
+    forma = [1] * ndim
+    for eje in ejes:
+        forma[eje] = 2
+    return factor.reshape(forma)
+
+
+def aplicar_nucleo(estado, nucleo):
+    """Aplica la puerta clasificada modificando estado en su sitio; devuelve estado"""
+    controles, objetivos, tipo, datos, inversa = nucleo
+    if tipo == "identidad":
+        return estado
+    if tipo == "densa" and not controles:
+        return aplicar_matriz(estado, datos, objetivos)
+
+    # Vista (sin copia) de las amplitudes con todos los controles a 1
+    seleccion = [slice(None)] * estado.ndim
+    for eje in controles:
+        seleccion[eje] = 1
+    # Con Ellipsis sigue siendo una vista aunque todos los ejes sean de control (CZ sobre 2 qubits)
+    vista = estado[tuple(seleccion) + (Ellipsis,)]
+    ejes = [eje - sum(c < eje for c in controles) for eje in objetivos]
+
+    if tipo == "diagonal":
+        vista *= _factor(datos, ejes, vista.ndim) if ejes else datos[0]
+    elif tipo == "permutacion":
+        t = len(ejes)
+        if t == 1 or (t == 2 and inversa.tolist() == [0, 2, 1, 3]):
+            # X intercambia las dos mitades del eje; SWAP, los bloques |01⟩ y |10⟩.
+            # Solo se mueven esos bloques, sin copiar el tensor entero
+            a, b = [slice(None)] * vista.ndim, [slice(None)] * vista.ndim
+            for eje, i, j in zip(ejes, (0, 1), (1, 0)):
+                a[eje], b[eje] = i, j
+            a, b = tuple(a), tuple(b)
+            bloque = vista[a].copy()
+            vista[a] = vista[b]
+            vista[b] = bloque
+        else:
+            movida = np.moveaxis(vista, ejes, range(t))
+            forma = movida.shape
+            permutada = movida.reshape(2 ** t, -1)[inversa].reshape(forma)
+            vista[...] = np.moveaxis(permutada, range(t), ejes)
+        if not np.allclose(datos, 1):
+            vista *= _factor(datos, ejes, vista.ndim)
+    else:
+        vista[...] = aplicar_matriz(vista, datos, ejes)
+    return estado
+
+
+class CircuitoLocal:
+    """Programa de pyQuil traducido a operaciones sobre el tensor de estado"""
+
+    def __init__(self, program, memoria=None):
+        self.qubits = sorted(program.get_qubit_indices())
+        self.num_qubits = len(self.qubits)
+        self.registros = {}
+        self.operaciones = []
+        self.nucleos = []
+        self.medidas = []
+
+        local = {q: i for i, q in enumerate(self.qubits)}
+        definiciones = {d.name: d for d in program.defined_gates}
+        medidos = set()
+        memoria = memoria or {}
+
+        for instr in program.instructions:
+            if isinstance(instr, Declare):
+                self.registros[instr.name] = (instr.memory_type, instr.memory_size)
+            elif isinstance(instr, Gate):
+                indices = [local[q.index] for q in instr.qubits]
+                if medidos.intersection(indices):
+                    raise ValueError("El simulador local solo admite medidas al final del circuito")
+                matriz = matriz_puerta(instr, definiciones, memoria)
+                ejes = [self.eje(i) for i in indices]
+                self.operaciones.append((matriz, ejes))
+                self.nucleos.append(clasificar(matriz, ejes))
+            elif isinstance(instr, Measurement):
+                i = local[instr.qubit.index]
+                medidos.add(i)
+                if instr.classical_reg is not None:
+                    ref = instr.classical_reg
+                    self.medidas.append((i, ref.name, ref.offset))
+            elif isinstance(instr, Halt):
+                break
+            elif not isinstance(instr, Pragma):
+                raise ValueError(f"Instrucción no soportada en el simulador local: {instr}")
+
+    def eje(self, qubit_local):
+        return self.num_qubits - 1 - qubit_local
+
+    def estado_inicial(self):
+        estado = np.zeros((2,) * self.num_qubits, dtype=np.complex128)
+        estado[(0,) * self.num_qubits] = 1
+        return estado
+
+    def evolucionar(self, estado=None, denso=False):
+        """Estado final; con denso=True, todas las puertas como contracción completa"""
+        if estado is None:
+            estado = self.estado_inicial()
+        else:
+            # Los núcleos trabajan en el sitio: no se toca el array del llamante
+            estado = np.array(estado, dtype=np.complex128)
+
+        if denso:
+            for matriz, ejes in self.operaciones:
+                estado = aplicar_matriz(estado, matriz, ejes)
+            return estado
+
+        for nucleo in self.nucleos:
+            estado = aplicar_nucleo(estado, nucleo)
+        return estado
+
+    def memoria_vacia(self, num_shots):
+        return reservar_memoria(self.registros, num_shots)
+
+    def leer_medidas(self, indices):
+        """Registros de cada shot a partir de los índices de base muestreados"""
+        registros = self.memoria_vacia(len(indices))
+        for qubit, nombre, offset in self.medidas:
+            registros[nombre][:, offset] = (indices >> qubit) & 1
+        return registros
+
+
+def tipo_numpy(tipo):
+    """dtype de una región DECLARE: int8 para BIT, int64 para OCTET/INTEGER y float64 para REAL"""
+    if tipo == "BIT":
+        return np.int8
+    return np.int64 if tipo in TIPOS_ENTEROS else np.float64
+
+
+def reservar_memoria(registros, num_shots):
+    """Registros clásicos enteros (nombre -> (tipo, tamaño)) para num_shots shots"""
+    return {
+        nombre: np.zeros((num_shots, tamaño), dtype=tipo_numpy(tipo))
+        for nombre, (tipo, tamaño) in registros.items()
+        if tipo in TIPOS_ENTEROS
+    }
+
+
+def estado_final(program, memoria=None):
+    """Amplitudes del estado final, en el orden de WavefunctionSimulator"""
+    circuito = CircuitoLocal(program, memoria)
+    return circuito.evolucionar().reshape(-1)
+
+
+def matriz_unitaria(program, memoria=None):
+    """
+    Unitaria del circuito (columna i = salida de la entrada |i⟩).
+
+    Evoluciona las 2^n entradas a la vez como un eje extra del tensor.
+    """
+    circuito = CircuitoLocal(program, memoria)
+    dim = 2 ** circuito.num_qubits
+    entradas = np.eye(dim, dtype=np.complex128).reshape((2,) * circuito.num_qubits + (dim,))
+    return circuito.evolucionar(entradas).reshape(dim, dim)
+
+
+def muestrear(probabilidades, num_shots, rng):
+    probabilidades = np.asarray(probabilidades, dtype=np.float64)
+    probabilidades = probabilidades / probabilidades.sum()
+    return rng.choice(len(probabilidades), size=num_shots, p=probabilidades)
+
+
+def ejecutar_local(program, num_shots=None, memoria=None, semilla=None):
+    """Ejecuta el programa en proceso y devuelve el mapa de registros"""
+    if num_shots is None:
+        num_shots = program.num_shots
+    registrar_ejecucion(num_shots)
+
+    rng = np.random.default_rng(semilla)
+    circuito = CircuitoLocal(program, memoria)
+    estado = circuito.evolucionar().reshape(-1)
+
+    indices = muestrear(np.abs(estado) ** 2, num_shots, rng)
+    return circuito.leer_medidas(indices)
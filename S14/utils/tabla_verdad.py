@@ -0,0 +1,94 @@
+"""
+Tablas de verdad de puertas y subcircuitos clásicos (SWAP, CNOT, CCNOT, CSWAP...).
+
+Las entradas y salidas son tuplas (q0, q1, ..., qn-1), el mismo orden que
+el registro "ro" de las prácticas del S07.
+"""
+
+import numpy as np
+from pyquil import Program
+from pyquil.gates import I, MEASURE, RX
+from pyquil.quilatom import MemoryReference
+from pyquil.quilbase import Declare
+
+from .quantum_utils import ejecutar_programa
+from .simulador_local import matriz_unitaria
+
+
+BACKENDS = ("unitaria", "local", "qvm")
+
+
+def _circuito(circuito, num_qubits):
+    # Identidades en todos los qubits para que la unitaria tenga dimensión 2^n
+    programa = Program([I(q) for q in range(num_qubits)])
+    return programa + Program(circuito)
+
+
+def _bits(indice, num_qubits):
+    return tuple((indice >> q) & 1 for q in range(num_qubits))
+
+
+def permutacion(circuito, num_qubits):
+    """
+    Permutación de la base computacional que realiza el circuito y la fase
+    de cada salida, calculadas directamente de la unitaria.
+
+    Lanza ValueError si alguna entrada no va a un único estado de la base.
+    """
+    unitaria = matriz_unitaria(_circuito(circuito, num_qubits))
+    salidas = np.abs(unitaria).argmax(axis=0)
+    entradas = np.arange(len(salidas))
+    fases = unitaria[salidas, entradas]
+
+    if not np.allclose(np.abs(fases), 1):
+        raise ValueError("El circuito crea superposiciones: no tiene tabla de verdad clásica")
+    return salidas, fases
+
+
+def programa_parametrico(circuito, num_qubits):
+    """
+    Un único programa para todas las entradas: RX(entrada[q]) prepara |0⟩
+    o |1⟩ (salvo fase global) según valga 0 o π, y se mide todo al final.
+    """
+    programa = Program(Declare("entrada", "REAL", num_qubits), Declare("ro", "BIT", num_qubits))
+    programa += [RX(MemoryReference("entrada", q), q) for q in range(num_qubits)]
+    programa += _circuito(circuito, num_qubits)
+    programa += [MEASURE(q, ("ro", q)) for q in range(num_qubits)]
+    return programa
+
+
+def _entradas(num_qubits):
+    return np.pi * np.array([_bits(i, num_qubits) for i in range(2 ** num_qubits)], dtype=np.float64)
+
+
+def tabla_verdad(circuito, num_qubits, backend="unitaria", num_shots=1, qvm_name='9q-square-qvm'):
+    """
+    Recorre las 2^n entradas de la base y devuelve [(entrada, salida), ...].
+
+    backend="unitaria" calcula la permutación sin muestrear; "local" y
+    "qvm" ejecutan el programa paramétrico con cada entrada y se quedan
+    con la salida más frecuente de los num_shots shots.
+    """
+    if backend == "unitaria":
+        salidas, _ = permutacion(circuito, num_qubits)
+        return [(_bits(i, num_qubits), _bits(s, num_qubits)) for i, s in enumerate(salidas)]
+
+    # Un solo compilado para las 2^n entradas: solo cambia la memoria "entrada"
+    registros = ejecutar_programa(programa_parametrico(circuito, num_qubits), num_shots, qvm_name,
+                                  backend=backend, parametros={"entrada": _entradas(num_qubits)})
+
+    tabla = []
+    for i, ro in enumerate(registros):
+        valores, veces = np.unique(np.asarray(ro), axis=0, return_counts=True)
+        tabla.append((_bits(i, num_qubits), tuple(int(b) for b in valores[veces.argmax()])))
+    return tabla
+
+
+def imprimir_tabla_verdad(tabla, titulo=None):
+    if titulo:
+        print(titulo)
+    num_qubits = len(tabla[0][0])
+    cabecera = " ".join(f"q{q}" for q in range(num_qubits))
+    print(f"{cabecera}  ->  {cabecera}")
+    for entrada, salida in tabla:
+        print(f"{' '.join(f'{b:>2}' for b in entrada)}  ->  {' '.join(f'{b:>2}' for b in salida)}")
@@ -0,0 +1,153 @@
+"""
+Simulación de ruido por trayectorias cuánticas (Monte Carlo de funciones de onda).
+
+En vez de la matriz densidad (4^n amplitudes), cada trayectoria es un
+vector de estado de 2^n amplitudes en el que, tras cada puerta, cada canal
+de Kraus del ModeloRuido elige uno de sus operadores K con probabilidad
+||K ψ||². La media sobre trayectorias converge a la distribución de
+densidad.distribucion_ruidosa.
+
+Las trayectorias se simulan por lotes, como un eje más del tensor de
+estado, y los lotes se reparten entre procesos con un flujo aleatorio
+independiente cada uno (SeedSequence.spawn).
+"""
+
+from concurrent.futures import as_completed
+
+import numpy as np
+from pyquil import Program
+
+from .decodificacion import bits_a_enteros
+from .densidad import distribucion_registro, mezclar_lectura
+from .lote import _ejecutor_procesos, _texto_quil
+from .perfilado import registrar_ejecucion
+from .ruido import aplicar_ruido_lectura
+from .simulador_local import CircuitoLocal, aplicar_matriz
+
+
+TRAYECTORIAS_POR_LOTE = 256
+
+
+def _saltar(estados, kraus, eje, rng):
+    """Aplica a cada trayectoria del lote uno de los operadores de Kraus, sorteado"""
+    ramas = np.stack([aplicar_matriz(estados, K, [eje]) for K in kraus])
+    pesos = np.sum(np.abs(ramas.reshape(len(kraus), len(estados), -1)) ** 2, axis=2)
+
+    acumulados = np.cumsum(pesos, axis=0)
+    sorteo = rng.random(len(estados)) * acumulados[-1]
+    elegidos = np.minimum((acumulados < sorteo).sum(axis=0), len(kraus) - 1)
+
+    trayectorias = np.arange(len(estados))
+    normas = np.sqrt(pesos[elegidos, trayectorias])
+    return ramas[elegidos, trayectorias] / normas.reshape((-1,) + (1,) * (estados.ndim - 1))
+
+
+def evolucionar_trayectorias(circuito, ruido, num_trayectorias, rng):
+    """Estados finales (num_trayectorias, 2^n), uno por trayectoria"""
+    estados = np.broadcast_to(circuito.estado_inicial(), (num_trayectorias,) + (2,) * circuito.num_qubits)
+    estados = estados.copy()
+    canales = ruido.canales() if ruido is not None else []
+
+    # El eje 0 es el de las trayectorias: los del estado se desplazan una posición
+    for matriz, ejes in circuito.operaciones:
+        ejes = [eje + 1 for eje in ejes]
+        estados = aplicar_matriz(estados, matriz, ejes)
+        for eje in ejes:
+            for kraus in canales:
+                estados = _saltar(estados, kraus, eje, rng)
+    return estados.reshape(num_trayectorias, -1)
+
+
+def _muestrear_filas(probabilidades, shots_por_fila, rng):
+    # Inversa de la acumulada de cada fila: un sorteo independiente por trayectoria.
+    # La acumulada normalizada de la fila i se desplaza en i para buscar todas a la vez
+    filas, dim = probabilidades.shape
+    acumuladas = np.cumsum(probabilidades, axis=1)
+    acumuladas /= acumuladas[:, -1:]
+    desplazamientos = np.arange(filas)[:, None]
+    sorteos = rng.random((filas, shots_por_fila)) + desplazamientos
+    indices = np.searchsorted((acumuladas + desplazamientos).reshape(-1), sorteos.reshape(-1))
+    indices = indices.reshape(filas, shots_por_fila) - desplazamientos * dim
+    return np.clip(indices, 0, dim - 1).reshape(-1)
+
+
+def _simular(circuito, ruido, num_trayectorias, shots_por_trayectoria, rng, tam_lote, registro, orden):
+    """Conteos del registro y suma de |ψ|² sobre la base de num_trayectorias trayectorias"""
+    num_bits = circuito.registros[registro][1]
+    conteos = np.zeros(2 ** num_bits, dtype=np.int64)
+    suma = np.zeros(2 ** circuito.num_qubits)
+
+    for inicio in range(0, num_trayectorias, tam_lote):
+        lote = min(tam_lote, num_trayectorias - inicio)
+        probabilidades = np.abs(evolucionar_trayectorias(circuito, ruido, lote, rng)) ** 2
+        suma += probabilidades.sum(axis=0)
+
+        bits = circuito.leer_medidas(_muestrear_filas(probabilidades, shots_por_trayectoria, rng))[registro]
+        if ruido is not None and ruido.confusion() is not None:
+            bits = aplicar_ruido_lectura(bits, ruido.p00, ruido.p11, rng=rng)
+        conteos += np.bincount(bits_a_enteros(bits, orden), minlength=len(conteos))
+
+    return conteos, suma
+
+
+def _simular_en_worker(quil, ruido, memoria, num_trayectorias, shots_por_trayectoria, semilla, tam_lote,
+                       registro, orden):
+    circuito = CircuitoLocal(Program(quil), memoria)
+    return _simular(circuito, ruido, num_trayectorias, shots_por_trayectoria, np.random.default_rng(semilla),
+                    tam_lote, registro, orden)
+
+
+def ejecutar_trayectorias(program, num_trayectorias, ruido=None, shots_por_trayectoria=1, memoria=None,
+                          max_workers=None, semilla=None, tam_lote=TRAYECTORIAS_POR_LOTE, registro="ro",
+                          orden="msb"):
+    """
+    Simula num_trayectorias trayectorias ruidosas y agrega sus resultados.
+
+    Devuelve un diccionario con los conteos del registro (valores 0..2^m-1
+    decodificados con `orden`, como densidad.probabilidades_registro) y la
+    estimación de su distribución promediando |ψ|² de cada trayectoria, que
+    tiene menos varianza que los conteos.
+
+    Con max_workers=1 todo se ejecuta en este proceso; si no, cada lote de
+    trayectorias va a un worker del pool de lote.py y los resultados se
+    suman según terminan. Con la misma semilla el resultado no depende del
+    número de procesos.
+    """
+    num_shots = num_trayectorias * shots_por_trayectoria
+    registrar_ejecucion(num_shots)
+
+    circuito = CircuitoLocal(program, memoria)
+    num_bits = circuito.registros[registro][1]
+    conteos = np.zeros(2 ** num_bits, dtype=np.int64)
+    suma = np.zeros(2 ** circuito.num_qubits)
+
+    tamaños = [min(tam_lote, num_trayectorias - i) for i in range(0, num_trayectorias, tam_lote)]
+    semillas = np.random.SeedSequence(semilla).spawn(len(tamaños))
+
+    if max_workers == 1:
+        resultados = (
+            _simular(circuito, ruido, tam, shots_por_trayectoria, np.random.default_rng(s), tam_lote,
+                     registro, orden)
+            for tam, s in zip(tamaños, semillas)
+        )
+    else:
+        quil = _texto_quil(program)
+        ejecutor = _ejecutor_procesos(max_workers)
+        futures = [
+            ejecutor.submit(_simular_en_worker, quil, ruido, memoria, tam, shots_por_trayectoria, s, tam_lote,
+                            registro, orden)
+            for tam, s in zip(tamaños, semillas)
+        ]
+        resultados = (f.result() for f in as_completed(futures))
+
+    for conteos_lote, suma_lote in resultados:
+        conteos += conteos_lote
+        suma += suma_lote
+
+    probabilidades = mezclar_lectura(suma / max(num_trayectorias, 1), circuito, ruido)
+    return {
+        'trayectorias': num_trayectorias,
+        'shots': num_shots,
+        'conteos': conteos,
+        'probabilidades': distribucion_registro(circuito, probabilidades, registro, orden)
+    }